@@ -7,20 +7,26 @@ memory management simulation, and deadlock detection.
 
 from __future__ import annotations
 
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Annotated, Any, Callable, Iterator, List, Optional
+
+import anyio
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
+from modules.memory_manager import NUMBA_MIN_LENGTH
+from modules.process_manager import MAX_FIELD_VALUE
 from simulator import Simulator
 
 # ── Pydantic Request / Response Models ───────────────────
 
 class ProcessInput(BaseModel):
     pid: str
-    arrival_time: int = Field(..., ge=0)
-    burst_time: int = Field(..., gt=0)
+    arrival_time: int = Field(..., ge=0, le=MAX_FIELD_VALUE)
+    burst_time: int = Field(..., gt=0, le=MAX_FIELD_VALUE)
     priority: int = Field(0, ge=0)
     memory_required: int = Field(0, ge=0)
 
@@ -36,14 +42,20 @@ class CompareRequest(BaseModel):
     quantum: Optional[int] = 2
 
 
+# Page numbers are kept to 32 bits.  The list stays a list: the Python
+# replacers iterate it directly and only the compiled Optimal kernel
+# packs it into an array.
+PageNumber = Annotated[int, Field(ge=-(2**31), le=2**31 - 1)]
+
+
 class MemoryRequest(BaseModel):
-    reference_string: List[int]
+    reference_string: List[PageNumber]
     num_frames: int = Field(4, gt=0, le=20)
     algorithm: str = "fifo"
 
 
 class MemoryCompareRequest(BaseModel):
-    reference_string: List[int]
+    reference_string: List[PageNumber]
     num_frames: int = Field(4, gt=0, le=20)
 
 
@@ -66,10 +78,26 @@ class DeadlockRequest(BaseModel):
 
 # ── App Setup ────────────────────────────────────────────
 
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson's C serializer.
+
+    orjson rejects integers beyond 64 bits, which unbounded fields such
+    as priority may hold; those responses use the stdlib encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content)
+        except orjson.JSONEncodeError:
+            return super().render(content)
+
+
 app = FastAPI(
     title="Mini OS Simulator API",
     description="Interactive OS scheduling, memory, and deadlock simulation",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -81,86 +109,183 @@ app.add_middleware(
 )
 
 
+EXPORT_CHUNK_SIZE = 64 * 1024   # approximate size of each streamed CSV chunk
+
+# Simulations at least this large run in a worker thread; smaller ones
+# finish faster than the thread hand-off and stay on the event loop.
+OFFLOAD_MIN_PROCESSES = 256
+OFFLOAD_MIN_PAGES = 2048
+OFFLOAD_MIN_GRAPH_ITEMS = 1024
+
+# /api/sample-data never changes, so it is serialized once at import
+SAMPLE_DATA = {
+    "processes": [
+        {"pid": "P1", "arrival_time": 0, "burst_time": 6, "priority": 2, "memory_required": 40},
+        {"pid": "P2", "arrival_time": 1, "burst_time": 8, "priority": 1, "memory_required": 30},
+        {"pid": "P3", "arrival_time": 2, "burst_time": 7, "priority": 3, "memory_required": 20},
+        {"pid": "P4", "arrival_time": 3, "burst_time": 3, "priority": 4, "memory_required": 15},
+        {"pid": "P5", "arrival_time": 5, "burst_time": 4, "priority": 2, "memory_required": 25},
+    ],
+    "reference_string": [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2],
+}
+_SAMPLE_DATA_JSON = orjson.dumps(SAMPLE_DATA)
+
+
+# ── Simulator Pool ───────────────────────────────────────
+
+# Simulators are reused across requests instead of being rebuilt each
+# time.  A simulator is checked out for the duration of one request, so
+# concurrent requests (including ones offloaded to worker threads) never
+# share process state.
+_SIM_POOL: List[Simulator] = []
+
+
+@contextmanager
+def _simulator() -> Iterator[Simulator]:
+    """
+    Borrow an empty Simulator from the pool for one request.
+
+    It is reset on return, so idle pooled simulators do not keep the
+    last request's processes alive.
+    """
+    sim = _SIM_POOL.pop() if _SIM_POOL else Simulator()
+    try:
+        yield sim
+    finally:
+        sim.reset()
+        _SIM_POOL.append(sim)
+
+
+async def _run_sized(size: int, threshold: int, func: Callable[..., Any], *args: Any) -> Any:
+    """Call func(*args) inline, or in a worker thread once size reaches threshold."""
+    if size >= threshold:
+        return await anyio.to_thread.run_sync(func, *args)
+    return func(*args)
+
+
+def _memory_offload_threshold(algorithm: str) -> int:
+    """
+    Reference-string length from which /api/memory leaves the event loop.
+
+    Optimal runs past NUMBA_MIN_LENGTH go through the Numba kernel, whose
+    first call compiles (or loads) it, so those are always offloaded.
+    """
+    if algorithm.lower() == "optimal":
+        return min(OFFLOAD_MIN_PAGES, NUMBA_MIN_LENGTH + 1)
+    return OFFLOAD_MIN_PAGES
+
+
 # ── Endpoints ────────────────────────────────────────────
 
 
 @app.post("/api/schedule")
-def schedule(req: ScheduleRequest):
+async def schedule(req: ScheduleRequest):
     """Run a single scheduling algorithm."""
     try:
-        sim = Simulator()
-        sim.load_processes([p.model_dump() for p in req.processes])
-        return sim.run_scheduling(req.algorithm, quantum=req.quantum or 2)
+        with _simulator() as sim:
+            sim.load_processes(req.processes)
+            return await _run_sized(
+                len(req.processes), OFFLOAD_MIN_PROCESSES,
+                sim.run_scheduling, req.algorithm, req.quantum or 2,
+            )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
 
 @app.post("/api/compare")
-def compare(req: CompareRequest):
+async def compare(req: CompareRequest):
     """Run all four scheduling algorithms and return comparison."""
     try:
-        sim = Simulator()
-        sim.load_processes([p.model_dump() for p in req.processes])
-        return sim.run_comparison(quantum=req.quantum or 2)
+        with _simulator() as sim:
+            sim.load_processes(req.processes)
+            # Four full simulations — keep them off the event loop
+            return await anyio.to_thread.run_sync(sim.run_comparison, req.quantum or 2)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
 
 @app.post("/api/memory")
-def memory(req: MemoryRequest):
+async def memory(req: MemoryRequest):
     """Run a page replacement simulation."""
     try:
-        sim = Simulator()
-        return sim.run_memory_simulation(
-            req.reference_string, req.num_frames, req.algorithm
-        )
+        with _simulator() as sim:
+            return await _run_sized(
+                len(req.reference_string), _memory_offload_threshold(req.algorithm),
+                sim.run_memory_simulation, req.reference_string, req.num_frames, req.algorithm,
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@app.post("/api/memory/stream")
+async def memory_stream(req: MemoryRequest):
+    """Stream a page replacement simulation as NDJSON, one step per line."""
+    try:
+        with _simulator() as sim:
+            # Only the algorithm is checked here; StreamingResponse pulls
+            # the steps from a worker thread, so the simulation itself
+            # never runs on the event loop.
+            steps = sim.iter_memory_simulation(
+                req.reference_string, req.num_frames, req.algorithm
+            )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
+    return StreamingResponse(_iter_ndjson(steps), media_type="application/x-ndjson")
 
 
 @app.post("/api/memory/compare")
-def memory_compare(req: MemoryCompareRequest):
+async def memory_compare(req: MemoryCompareRequest):
     """Run all three page replacement algorithms."""
     try:
-        sim = Simulator()
-        return sim.run_memory_comparison(req.reference_string, req.num_frames)
+        with _simulator() as sim:
+            # Only aggregate faults/hits are shown, so skip per-step history
+            return await anyio.to_thread.run_sync(
+                sim.run_memory_comparison, req.reference_string, req.num_frames, False
+            )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
 
 @app.post("/api/deadlock")
-def deadlock(req: DeadlockRequest):
+async def deadlock(req: DeadlockRequest):
     """Detect deadlock from a Resource Allocation Graph."""
     try:
-        sim = Simulator()
-        graph_data = {
-            "processes": req.processes,
-            "resources": [r.model_dump() for r in req.resources],
-            "requests": [e.model_dump() for e in req.requests],
-            "assignments": [e.model_dump() for e in req.assignments],
-        }
-        return sim.run_deadlock_detection(graph_data)
+        with _simulator() as sim:
+            graph_data = {
+                "processes": req.processes,
+                "resources": [(r.id, r.instances) for r in req.resources],
+                "requests": [(e.process, e.resource) for e in req.requests],
+                "assignments": [(e.process, e.resource) for e in req.assignments],
+            }
+            size = len(req.processes) + len(req.requests) + len(req.assignments)
+            return await _run_sized(
+                size, OFFLOAD_MIN_GRAPH_ITEMS, sim.run_deadlock_detection, graph_data
+            )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
 
 @app.get("/api/sample-data")
-def sample_data():
+async def sample_data():
     """Return sample datasets for quick testing."""
-    return {
-        "processes": [
-            {"pid": "P1", "arrival_time": 0, "burst_time": 6, "priority": 2, "memory_required": 40},
-            {"pid": "P2", "arrival_time": 1, "burst_time": 8, "priority": 1, "memory_required": 30},
-            {"pid": "P3", "arrival_time": 2, "burst_time": 7, "priority": 3, "memory_required": 20},
-            {"pid": "P4", "arrival_time": 3, "burst_time": 3, "priority": 4, "memory_required": 15},
-            {"pid": "P5", "arrival_time": 5, "burst_time": 4, "priority": 2, "memory_required": 25},
-        ],
-        "reference_string": [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2],
-    }
+    return Response(
+        content=_SAMPLE_DATA_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
+
+
+def _iter_ndjson(items: Iterator[dict]) -> Iterator[bytes]:
+    """Encode each item as one line of newline-delimited JSON."""
+    for item in items:
+        yield orjson.dumps(item) + b"\n"
 
 
 @app.post("/api/export")
-def export(data: List[dict]):
-    """Export data as CSV."""
-    csv_string = Simulator.export_csv(data)
-    return PlainTextResponse(content=csv_string, media_type="text/csv")
+async def export(data: List[dict]):
+    """Export data as CSV, written and streamed in ~64 KB chunks."""
+    try:
+        chunks = Simulator.iter_export_csv(data, EXPORT_CHUNK_SIZE)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return StreamingResponse(chunks, media_type="text/csv")
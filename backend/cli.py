@@ -19,7 +19,7 @@ import csv
 import sys
 from typing import List
 
-from config import setup_logging
+from config import get_logger
 from simulator import Simulator
 
 
@@ -80,9 +80,8 @@ def cmd_schedule(args):
 
     # Export
     if args.export:
-        csv_str = Simulator.export_csv(result["metrics"])
-        with open(args.export, "w", encoding="utf-8") as f:
-            f.write(csv_str)
+        with open(args.export, "w", encoding="utf-8", newline="") as f:
+            Simulator.export_csv(result["metrics"], file=f)
         print(f"  ✓ Exported to {args.export}\n")
 
 
@@ -109,7 +108,7 @@ def cmd_memory(args):
 
     sim = Simulator()
     if args.compare_all:
-        results = sim.run_memory_comparison(ref_string, args.frames)
+        results = sim.run_memory_comparison(ref_string, args.frames, record_history=False)
         print_table(
             ["Algorithm", "Faults", "Hits", "Hit Rate"],
             [[r["algorithm"], r["total_faults"], r["total_hits"],
@@ -163,7 +162,7 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    setup_logging()
+    get_logger()
 
     commands = {"schedule": cmd_schedule, "compare": cmd_compare, "memory": cmd_memory}
     commands[args.command](args)
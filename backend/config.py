@@ -6,6 +6,7 @@ making it easy to adjust defaults without modifying core logic.
 """
 
 import logging
+import logging.handlers
 import os
 
 # ──────────────────────────────────────────────
@@ -22,11 +23,19 @@ DEFAULT_PAGE_SIZE_KB = 4          # Page size in KB
 LOG_LEVEL = os.getenv("SIM_LOG_LEVEL", "INFO")
 LOG_FORMAT = "%(asctime)s | %(levelname)-7s | %(name)s | %(message)s"
 LOG_FILE = "simulation.log"
+LOG_MAX_BYTES = 1_000_000         # Rotate simulation.log after ~1 MB
+LOG_BACKUP_COUNT = 3
 
 
 def setup_logging() -> logging.Logger:
-    """Configure and return the root simulator logger."""
+    """
+    Configure and return the root simulator logger.
+
+    Safe to call repeatedly: handlers are only attached the first time.
+    """
     logger = logging.getLogger("os_simulator")
+    if logger.handlers:
+        return logger
     logger.setLevel(getattr(logging, LOG_LEVEL.upper(), logging.INFO))
 
     # Console handler
@@ -34,16 +43,37 @@ def setup_logging() -> logging.Logger:
     console.setFormatter(logging.Formatter(LOG_FORMAT))
     logger.addHandler(console)
 
-    # File handler — skip on read-only filesystems (e.g. Vercel serverless)
-    try:
-        file_handler = logging.FileHandler(LOG_FILE, mode="a", encoding="utf-8")
+    # File handler — opened lazily on first record; skipped on Vercel and
+    # other read-only filesystems
+    log_dir = os.path.dirname(os.path.abspath(LOG_FILE))
+    if not os.environ.get("VERCEL") and os.access(log_dir, os.W_OK):
+        file_handler = logging.handlers.RotatingFileHandler(
+            LOG_FILE,
+            mode="a",
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
         file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
         logger.addHandler(file_handler)
-    except OSError:
+    else:
         logger.debug("File logging disabled (read-only filesystem)")
 
     return logger
 
 
-# Create logger on import
-logger = setup_logging()
+_logger_singleton = None
+
+
+def get_logger() -> logging.Logger:
+    """
+    Return the simulator logger, configuring it on first use.
+
+    Keeps handler setup off the import path so serverless cold starts
+    don't pay for it.
+    """
+    global _logger_singleton
+    if _logger_singleton is None:
+        _logger_singleton = setup_logging()
+    return _logger_singleton
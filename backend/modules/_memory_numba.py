@@ -0,0 +1,85 @@
+"""
+_memory_numba.py - Numba-compiled kernel for Optimal page replacement.
+
+Optional accelerator used by OptimalPageReplacer for long reference
+strings.  Importing this module requires numba; memory_manager falls
+back to the pure-Python path when it is unavailable.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def optimal_simulate(page_ids, num_frames, record):
+    """
+    Simulate Optimal replacement over densely numbered pages.
+
+    Args:
+        page_ids:   int array of page ids in [0, num_pages), one per reference.
+        num_frames: Number of page frames available.
+        record:     Fill frames_flat/frame_counts; when False they are
+                    returned empty.
+
+    Returns:
+        (fault_flags, frames_flat, frame_counts) where row `step` of
+        frames_flat (reshaped to n × num_frames) holds the resident page
+        ids after that step, and frame_counts[step] how many are valid.
+    """
+    n = page_ids.shape[0]
+    num_pages = 0
+    for i in range(n):
+        if page_ids[i] + 1 > num_pages:
+            num_pages = page_ids[i] + 1
+
+    # Next-use table: index of the next reference to the same page
+    nxt = np.empty(n, dtype=np.int64)
+    last_seen = np.full(num_pages, n, dtype=np.int64)
+    for i in range(n - 1, -1, -1):
+        nxt[i] = last_seen[page_ids[i]]
+        last_seen[page_ids[i]] = i
+
+    frames = np.empty(num_frames, dtype=np.int64)
+    last_ref = np.empty(num_frames, dtype=np.int64)
+    slot = np.full(num_pages, -1, dtype=np.int64)
+    count = 0
+
+    fault_flags = np.zeros(n, dtype=np.bool_)
+    history_len = n if record else 0
+    frames_flat = np.zeros(history_len * num_frames, dtype=np.int64)
+    frame_counts = np.empty(history_len, dtype=np.int64)
+
+    for step in range(n):
+        page = page_ids[step]
+        if slot[page] >= 0:
+            last_ref[slot[page]] = step
+        else:
+            fault_flags[step] = True
+            if count >= num_frames:
+                # First frame whose next use is furthest away (or never)
+                victim = 0
+                farthest = -1
+                for j in range(count):
+                    if nxt[last_ref[j]] > farthest:
+                        farthest = nxt[last_ref[j]]
+                        victim = j
+                slot[frames[victim]] = -1
+                for j in range(victim, count - 1):
+                    frames[j] = frames[j + 1]
+                    last_ref[j] = last_ref[j + 1]
+                    slot[frames[j]] = j
+                count -= 1
+            frames[count] = page
+            last_ref[count] = step
+            slot[page] = count
+            count += 1
+
+        if record:
+            base = step * num_frames
+            for j in range(count):
+                frames_flat[base + j] = frames[j]
+            frame_counts[step] = count
+
+    return fault_flags, frames_flat, frame_counts
@@ -3,12 +3,13 @@ deadlock_detector.py - Resource Allocation Graph (RAG) and deadlock detection.
 
 Models processes, resources, and their request/assignment edges as a
 directed graph.  Detects deadlock by searching for cycles in the
-corresponding wait-for graph using DFS.
+corresponding wait-for graph using an iterative Tarjan SCC pass.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set, Tuple
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
 
 
 class ResourceAllocationGraph:
@@ -25,7 +26,7 @@ class ResourceAllocationGraph:
 
     Deadlock Detection:
         Builds a wait-for graph (process → process) from the RAG and
-        searches for cycles via depth-first search.
+        searches for cycles via Tarjan's strongly connected components.
     """
 
     def __init__(self):
@@ -60,72 +61,117 @@ class ResourceAllocationGraph:
 
     # ── Deadlock Detection ───────────────────────────────
 
-    def _build_wait_for_graph(self) -> Dict[str, Set[str]]:
+    def _build_wait_for_graph(self) -> Tuple[List[str], List[List[int]]]:
         """
-        Derive a wait-for graph (process → set of processes).
+        Derive a wait-for graph (process → processes it waits for).
 
         For each request (P_i → R_k), find all assignments (R_k → P_j)
         where j ≠ i.  This means P_i is waiting for P_j.
+
+        Returns:
+            (pids, adj) where pids maps index → PID and adj[i] lists the
+            indices of the processes that pids[i] is waiting for.
         """
-        wfg: Dict[str, Set[str]] = {p: set() for p in self.processes}
+        pids = list(self.processes)
+        pid_to_idx = {pid: i for i, pid in enumerate(pids)}
+        wfg: List[Set[int]] = [set() for _ in pids]
 
-        # Map: resource → set of processes holding it
-        holders: Dict[str, Set[str]] = {}
+        # Map: resource → indices of processes holding it
+        holders: Dict[str, Set[int]] = defaultdict(set)
         for rid, pid in self.assignments:
-            holders.setdefault(rid, set()).add(pid)
+            holders[rid].add(pid_to_idx[pid])
 
         # For each request, connect requester to holders
         for pid, rid in self.requests:
-            for holder in holders.get(rid, set()):
-                if holder != pid:
-                    wfg.setdefault(pid, set()).add(holder)
-
-        return wfg
+            i = pid_to_idx[pid]
+            wfg[i].update(h for h in holders.get(rid, ()) if h != i)
+
+        return pids, [list(edges) for edges in wfg]
+
+    @staticmethod
+    def _cycle_in_scc(scc: List[int], adj: List[List[int]]) -> List[int]:
+        """Walk edges inside a non-trivial SCC until a node repeats."""
+        n = len(adj)
+        in_scc = [False] * n
+        for node in scc:
+            in_scc[node] = True
+        seen_at = [-1] * n          # position of each node on the walk
+        path: List[int] = []
+        node = scc[0]
+        while seen_at[node] == -1:
+            seen_at[node] = len(path)
+            path.append(node)
+            node = next(w for w in adj[node] if in_scc[w])
+        return path[seen_at[node]:]
 
     def detect_deadlock(self) -> Dict:
         """
         Detect deadlock by finding cycles in the wait-for graph.
 
+        Any strongly connected component with more than one process
+        (or a self-loop) contains a cycle.  Tarjan's algorithm is run
+        with an explicit work stack so large graphs cannot hit the
+        recursion limit.
+
         Returns:
             {
                 "deadlocked": bool,
                 "cycle": list of PIDs forming the cycle, or None
             }
         """
-        wfg = self._build_wait_for_graph()
-
-        # DFS-based cycle detection
-        WHITE, GRAY, BLACK = 0, 1, 2
-        color = {node: WHITE for node in wfg}
-        parent: Dict[str, Optional[str]] = {node: None for node in wfg}
-
-        def dfs(node: str) -> Optional[List[str]]:
-            color[node] = GRAY
-            for neighbor in wfg.get(node, set()):
-                if neighbor not in color:
+        pids, adj = self._build_wait_for_graph()
+        n = len(pids)
+
+        index = [-1] * n
+        lowlink = [0] * n
+        on_stack = [False] * n
+        scc_stack: List[int] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+
+            index[root] = lowlink[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(adj[root]))]
+
+            while work:
+                node, neighbors = work[-1]
+                descended = False
+                for w in neighbors:
+                    if index[w] == -1:
+                        index[w] = lowlink[w] = counter
+                        counter += 1
+                        scc_stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, iter(adj[w])))
+                        descended = True
+                        break
+                    if on_stack[w] and index[w] < lowlink[node]:
+                        lowlink[node] = index[w]
+                if descended:
                     continue
-                if color[neighbor] == GRAY:
-                    # Found a cycle — reconstruct it
-                    cycle = [neighbor, node]
-                    current = node
-                    while parent.get(current) and parent[current] != neighbor:
-                        current = parent[current]
-                        cycle.append(current)
-                    cycle.reverse()
-                    return cycle
-                if color[neighbor] == WHITE:
-                    parent[neighbor] = node
-                    result = dfs(neighbor)
-                    if result:
-                        return result
-            color[node] = BLACK
-            return None
-
-        for node in wfg:
-            if color.get(node) == WHITE:
-                cycle = dfs(node)
-                if cycle:
-                    return {"deadlocked": True, "cycle": cycle}
+
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    if lowlink[node] < lowlink[caller]:
+                        lowlink[caller] = lowlink[node]
+
+                if lowlink[node] == index[node]:
+                    scc: List[int] = []
+                    while True:
+                        w = scc_stack.pop()
+                        on_stack[w] = False
+                        scc.append(w)
+                        if w == node:
+                            break
+                    if len(scc) > 1 or node in adj[node]:
+                        cycle = self._cycle_in_scc(scc, adj)
+                        return {"deadlocked": True, "cycle": [pids[i] for i in cycle]}
 
         return {"deadlocked": False, "cycle": None}
 
@@ -7,14 +7,27 @@ Implements three classic page replacement policies:
   • Optimal — replaces the page not needed for the longest time (look-ahead)
 
 Each algorithm processes a reference string against a fixed number of
-frames and returns fault/hit counts plus a step-by-step frame history.
+frames and returns fault/hit counts plus a step-by-step frame history,
+or streams the steps one at a time via simulate_iter().  simulate_all()
+runs all three policies side by side in a single pass.
 """
 
 from __future__ import annotations
 
-from collections import OrderedDict, deque
+from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+try:
+    from ._memory_numba import optimal_simulate
+except (ImportError, RuntimeError):  # numba missing, or no writable JIT cache
+    optimal_simulate = None
+
+# Below this length the JIT dispatch overhead outweighs the kernel speedup
+NUMBA_MIN_LENGTH = 64
 
 
 @dataclass
@@ -26,58 +39,117 @@ class MemoryResult:
         total_faults: Number of page faults that occurred.
         total_hits:   Number of page hits.
         hit_rate:     Fraction of accesses that were hits (.0–1.0).
-        history:      Step-by-step frame snapshots for visualization.
+        history:      Step-by-step frame snapshots for visualization, as
+                      (step, page, frames, fault) tuples with frames as a
+                      tuple; empty when not recorded.
     """
     total_faults: int = 0
     total_hits: int = 0
     hit_rate: float = 0.0
-    history: List[dict] = field(default_factory=list)
+    history: List[Tuple[int, int, Tuple[int, ...], bool]] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         return {
             "total_faults": self.total_faults,
             "total_hits": self.total_hits,
             "hit_rate": round(self.hit_rate, 4),
-            "history": self.history,
+            "history": [
+                {"step": step, "page": page, "frames": list(frames), "fault": fault}
+                for step, page, frames, fault in self.history
+            ],
         }
 
 
+def _as_page_list(reference_string) -> List[int]:
+    """
+    Accept a list or NumPy array of pages; iterate it as plain ints.
+
+    bytes-like inputs (page ids 0–255) are passed through unchanged,
+    since indexing and iterating them already yields ints.
+    """
+    if isinstance(reference_string, np.ndarray):
+        return reference_string.tolist()
+    return reference_string
+
+
+def _as_page_array(reference_string) -> np.ndarray:
+    """Return the pages as an int64 array, reading bytes-like input in place."""
+    if isinstance(reference_string, (bytes, bytearray, memoryview)):
+        return np.frombuffer(reference_string, dtype=np.uint8).astype(np.int64)
+    return np.asarray(reference_string, dtype=np.int64)
+
+
+class PageReplacer(ABC):
+    """
+    Shared driver for page replacement policies.
+
+    Subclasses implement _steps(), a generator yielding
+    (step, page, frames, fault) for every reference, where `frames` is
+    the policy's live frame container in memory order.  simulate()
+    aggregates those steps into a MemoryResult; simulate_iter() streams
+    them as JSON-ready dicts.
+    """
+
+    @abstractmethod
+    def _steps(
+        self, reference_string: List[int], num_frames: int
+    ) -> Iterator[Tuple[int, int, Iterable[int], bool]]:
+        """Yield (step, page, frames, fault) for each reference."""
+
+    def simulate_iter(self, reference_string: List[int], num_frames: int) -> Iterator[dict]:
+        """Yield one {step, page, frames, fault} dict per reference."""
+        for step, page, frames, fault in self._steps(_as_page_list(reference_string), num_frames):
+            yield {"step": step, "page": page, "frames": list(frames), "fault": fault}
+
+    def simulate(
+        self, reference_string: List[int], num_frames: int, record_history: bool = True
+    ) -> MemoryResult:
+        reference_string = _as_page_list(reference_string)
+        total = len(reference_string)
+        # Count in locals and fill a pre-sized history; write back once
+        hits = faults = 0
+        history: list = [None] * total if record_history else []
+
+        for step, page, frames, fault in self._steps(reference_string, num_frames):
+            if fault:
+                faults += 1
+            else:
+                hits += 1
+            if record_history:
+                history[step] = (step, page, tuple(frames), fault)
+
+        return MemoryResult(
+            total_faults=faults,
+            total_hits=hits,
+            hit_rate=hits / total if total > 0 else 0,
+            history=history,
+        )
+
+
 # ══════════════════════════════════════════════════════════
 #  1. FIFO Page Replacement
 # ══════════════════════════════════════════════════════════
 
 
-class FIFOPageReplacer:
+class FIFOPageReplacer(PageReplacer):
     """
     First-In-First-Out page replacement.
     The page that has been in memory the longest is replaced first.
     """
 
-    def simulate(self, reference_string: List[int], num_frames: int) -> MemoryResult:
-        frames: deque = deque()
-        result = MemoryResult()
+    def _steps(self, reference_string: List[int], num_frames: int):
+        frames: deque = deque(maxlen=num_frames)   # append evicts the oldest
+        resident: set = set()   # mirrors frames for O(1) membership
 
         for step, page in enumerate(reference_string):
-            fault = False
-            if page in frames:
-                result.total_hits += 1
+            if page in resident:
+                yield step, page, frames, False
             else:
-                fault = True
-                result.total_faults += 1
-                if len(frames) >= num_frames:
-                    evicted = frames.popleft()
+                if len(frames) == num_frames:
+                    resident.discard(frames[0])
                 frames.append(page)
-
-            result.history.append({
-                "step": step,
-                "page": page,
-                "frames": list(frames),
-                "fault": fault,
-            })
-
-        total = len(reference_string)
-        result.hit_rate = result.total_hits / total if total > 0 else 0
-        return result
+                resident.add(page)
+                yield step, page, frames, True
 
 
 # ══════════════════════════════════════════════════════════
@@ -85,41 +157,28 @@ class FIFOPageReplacer:
 # ══════════════════════════════════════════════════════════
 
 
-class LRUPageReplacer:
+class LRUPageReplacer(PageReplacer):
     """
     Least Recently Used page replacement.
     Replaces the page whose last access is furthest in the past.
-    Uses an OrderedDict to efficiently track recency.
+    Uses an insertion-ordered dict to efficiently track recency.
     """
 
-    def simulate(self, reference_string: List[int], num_frames: int) -> MemoryResult:
-        frames: OrderedDict = OrderedDict()
-        result = MemoryResult()
+    def _steps(self, reference_string: List[int], num_frames: int):
+        frames: Dict[int, bool] = {}
 
         for step, page in enumerate(reference_string):
-            fault = False
             if page in frames:
-                result.total_hits += 1
-                # Move to end (most recently used)
-                frames.move_to_end(page)
+                # Re-insert at the end (most recently used)
+                del frames[page]
+                frames[page] = True
+                yield step, page, frames, False
             else:
-                fault = True
-                result.total_faults += 1
                 if len(frames) >= num_frames:
                     # Evict least recently used (first item)
-                    frames.popitem(last=False)
+                    del frames[next(iter(frames))]
                 frames[page] = True
-
-            result.history.append({
-                "step": step,
-                "page": page,
-                "frames": list(frames.keys()),
-                "fault": fault,
-            })
-
-        total = len(reference_string)
-        result.hit_rate = result.total_hits / total if total > 0 else 0
-        return result
+                yield step, page, frames, True
 
 
 # ══════════════════════════════════════════════════════════
@@ -127,7 +186,7 @@ class LRUPageReplacer:
 # ══════════════════════════════════════════════════════════
 
 
-class OptimalPageReplacer:
+class OptimalPageReplacer(PageReplacer):
     """
     Optimal (Bélády's) page replacement.
     Replaces the page that will not be used for the longest time
@@ -135,40 +194,112 @@ class OptimalPageReplacer:
     knowledge of the full reference string.
     """
 
-    def simulate(self, reference_string: List[int], num_frames: int) -> MemoryResult:
-        frames: List[int] = []
+    @staticmethod
+    def _next_occurrences(reference_string: List[int]) -> np.ndarray:
+        """
+        Build the next-use table in a single reverse pass.
+
+        nxt[i] is the index of the next reference to the page at
+        position i, or len(reference_string) if it is never used again.
+        """
+        n = len(reference_string)
+        nxt = np.full(n, n, dtype=np.int32)
+        last_seen: Dict[int, int] = {}
+        for i in range(n - 1, -1, -1):
+            page = reference_string[i]
+            if page in last_seen:
+                nxt[i] = last_seen[page]
+            last_seen[page] = i
+        return nxt
+
+    @staticmethod
+    def _simulate_compiled(
+        reference_string: List[int], num_frames: int, record_history: bool
+    ) -> MemoryResult:
+        """Run the Numba kernel and repackage its arrays as a MemoryResult."""
+        pages, page_ids = np.unique(_as_page_array(reference_string), return_inverse=True)
+        fault_flags, frames_flat, frame_counts = optimal_simulate(page_ids, num_frames, record_history)
+
+        total = len(reference_string)
         result = MemoryResult()
+        result.total_faults = int(fault_flags.sum())
+        result.total_hits = total - result.total_faults
+        result.hit_rate = result.total_hits / total
+
+        if record_history:
+            refs = pages[page_ids].tolist()
+            rows = pages[frames_flat].reshape(total, num_frames).tolist()
+            faults = fault_flags.tolist()
+            counts = frame_counts.tolist()
+            result.history = [
+                (step, refs[step], tuple(rows[step][:counts[step]]), faults[step])
+                for step in range(total)
+            ]
+        return result
+
+    def simulate(
+        self, reference_string: List[int], num_frames: int, record_history: bool = True
+    ) -> MemoryResult:
+        if optimal_simulate is not None and len(reference_string) > NUMBA_MIN_LENGTH:
+            return self._simulate_compiled(reference_string, num_frames, record_history)
+        return super().simulate(reference_string, num_frames, record_history)
+
+    def _steps(self, reference_string: List[int], num_frames: int):
+        frames: List[int] = []
+        last_ref: Dict[int, int] = {}   # resident page → index of its latest reference
+        nxt = self._next_occurrences(reference_string)
 
         for step, page in enumerate(reference_string):
-            fault = False
-            if page in frames:
-                result.total_hits += 1
+            if page in last_ref:
+                last_ref[page] = step
+                yield step, page, frames, False
             else:
-                fault = True
-                result.total_faults += 1
                 if len(frames) >= num_frames:
-                    # Find the page used furthest in the future (or never)
-                    farthest_use = -1
-                    victim = frames[0]
-                    for f in frames:
-                        try:
-                            next_use = reference_string[step + 1:].index(f)
-                        except ValueError:
-                            victim = f
-                            break
-                        if next_use > farthest_use:
-                            farthest_use = next_use
-                            victim = f
-                    frames.remove(victim)
+                    # Evict the page used furthest in the future (or never);
+                    # argmax picks the first such frame on ties.
+                    positions = [last_ref[f] for f in frames]
+                    victim = frames.pop(int(np.argmax(nxt[positions])))
+                    del last_ref[victim]
                 frames.append(page)
+                last_ref[page] = step
+                yield step, page, frames, True
 
-            result.history.append({
-                "step": step,
-                "page": page,
-                "frames": list(frames),
-                "fault": fault,
-            })
 
-        total = len(reference_string)
-        result.hit_rate = result.total_hits / total if total > 0 else 0
-        return result
+# ══════════════════════════════════════════════════════════
+#  Fused comparison run
+# ══════════════════════════════════════════════════════════
+
+
+def simulate_all(
+    reference_string: List[int], num_frames: int, record_history: bool = True
+) -> Tuple[MemoryResult, MemoryResult, MemoryResult]:
+    """
+    Run FIFO, LRU and Optimal over one reference string in a single pass.
+
+    The three replacers' _steps() generators are advanced in lockstep,
+    one reference at a time, instead of walking the string once per
+    policy.  Returns (fifo, lru, optimal) results matching each
+    replacer's simulate().
+    """
+    reference_string = _as_page_list(reference_string)
+    total = len(reference_string)
+    replacers = (FIFOPageReplacer(), LRUPageReplacer(), OptimalPageReplacer())
+    faults = [0] * len(replacers)
+    histories = [[None] * total if record_history else [] for _ in replacers]
+
+    for steps in zip(*(r._steps(reference_string, num_frames) for r in replacers)):
+        for i, (step, page, frames, fault) in enumerate(steps):
+            if fault:
+                faults[i] += 1
+            if record_history:
+                histories[i][step] = (step, page, tuple(frames), fault)
+
+    return tuple(
+        MemoryResult(
+            total_faults=f,
+            total_hits=total - f,
+            hit_rate=(total - f) / total if total > 0 else 0,
+            history=history,
+        )
+        for f, history in zip(faults, histories)
+    )
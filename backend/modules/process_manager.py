@@ -9,20 +9,52 @@ bulk operations (create, load, validate, reset).
 from __future__ import annotations
 
 import csv
+import os
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import List, Optional
+from enum import IntEnum
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 
-class ProcessState(str, Enum):
-    """Possible lifecycle states of a process."""
-    READY = "READY"
-    RUNNING = "RUNNING"
-    WAITING = "WAITING"
-    COMPLETED = "COMPLETED"
+# dataclass(slots=True) needs Python 3.10+; older interpreters fall back
+# to a regular __dict__-backed class.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
+# CSV files at least this large are parsed with pandas' C reader when
+# pandas is installed; smaller ones are not worth the import cost.
+PANDAS_CSV_MIN_BYTES = 1 << 20
 
-@dataclass
+# Beyond this size pyarrow's multithreaded reader is preferred, if present.
+ARROW_CSV_MIN_BYTES = 64 << 20
+
+# Upper bound for arrival_time and burst_time.  Keeps the schedulers'
+# int64 arithmetic (sums of bursts, completion times) from wrapping.
+MAX_FIELD_VALUE = 2**31 - 1
+
+_CSV_INT_DTYPES = {
+    "arrival_time": "int64",
+    "burst_time": "int64",
+    "priority": "int64",
+    "memory_required": "int64",
+}
+
+
+class ProcessState(IntEnum):
+    """
+    Possible lifecycle states of a process.
+
+    Integer-valued for cheap comparisons; serialized by name.
+    """
+    READY = 0
+    RUNNING = 1
+    WAITING = 2
+    COMPLETED = 3
+
+
+@dataclass(**_SLOTS)
 class Process:
     """
     Represents a single process in the simulator.
@@ -58,6 +90,16 @@ class Process:
         if self.remaining_time is None:
             self.remaining_time = self.burst_time
 
+    def clone(self) -> "Process":
+        """Return a fresh copy with the input fields only (timing state reset)."""
+        return Process(
+            pid=self.pid,
+            arrival_time=self.arrival_time,
+            burst_time=self.burst_time,
+            priority=self.priority,
+            memory_required=self.memory_required,
+        )
+
     def reset(self) -> None:
         """Reset process to initial state for re-simulation."""
         self.state = ProcessState.READY
@@ -70,20 +112,94 @@ class Process:
 
     def to_dict(self) -> dict:
         """Serialize process to a plain dictionary."""
-        return {
-            "pid": self.pid,
-            "arrival_time": self.arrival_time,
-            "burst_time": self.burst_time,
-            "priority": self.priority,
-            "memory_required": self.memory_required,
-            "state": self.state.value,
-            "remaining_time": self.remaining_time,
-            "start_time": self.start_time,
-            "completion_time": self.completion_time,
-            "waiting_time": self.waiting_time,
-            "turnaround_time": self.turnaround_time,
-            "response_time": self.response_time,
-        }
+        d = dict(zip(_PROC_FIELDS, _get_proc_fields(self)))
+        d["state"] = self.state.name
+        return d
+
+
+# Serialized field order for Process.to_dict
+_PROC_FIELDS = (
+    "pid", "arrival_time", "burst_time", "priority", "memory_required", "state",
+    "remaining_time", "start_time", "completion_time", "waiting_time",
+    "turnaround_time", "response_time",
+)
+_get_proc_fields = attrgetter(*_PROC_FIELDS)
+
+
+def to_soa(processes: List[Process], dtype: Any = np.int64) -> Dict[str, np.ndarray]:
+    """
+    Mirror the scheduling inputs of a process list as parallel arrays.
+
+    Returns arrays (int64 by default) keyed by "arrival", "burst",
+    "priority" and "memory", indexed in the same order as `processes`.
+    Raises OverflowError if a value does not fit `dtype`; pass
+    dtype=object to keep exact Python ints.
+    """
+    n = len(processes)
+    return {
+        "arrival": np.fromiter((p.arrival_time for p in processes), dtype=dtype, count=n),
+        "burst": np.fromiter((p.burst_time for p in processes), dtype=dtype, count=n),
+        "priority": np.fromiter((p.priority for p in processes), dtype=dtype, count=n),
+        "memory": np.fromiter((p.memory_required for p in processes), dtype=dtype, count=n),
+    }
+
+
+def _read_csv_columns_pandas(filepath: str) -> Optional[Tuple[List[Any], ...]]:
+    """
+    Parse a process CSV with pandas' C engine.
+
+    Returns (pids, arrival, burst, priority, memory) as plain Python
+    lists, or None when pandas is not installed.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+
+    # keep_default_na=False: pids such as "NA" or "null" stay strings
+    df = pd.read_csv(
+        filepath, dtype={"pid": str, **_CSV_INT_DTYPES}, engine="c", keep_default_na=False
+    )
+    n = len(df)
+    zeros = [0] * n
+    return (
+        df["pid"].tolist(),
+        df["arrival_time"].tolist(),
+        df["burst_time"].tolist(),
+        df["priority"].tolist() if "priority" in df else zeros,
+        df["memory_required"].tolist() if "memory_required" in df else zeros,
+    )
+
+
+def _read_csv_columns_arrow(filepath: str) -> Optional[Tuple[List[Any], ...]]:
+    """
+    Parse a process CSV with pyarrow's multithreaded reader.
+
+    Same return shape as _read_csv_columns_pandas; None when pyarrow
+    is not installed.
+    """
+    try:
+        from pyarrow import csv as pacsv
+    except ImportError:
+        return None
+
+    table = pacsv.read_csv(
+        filepath,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        parse_options=pacsv.ParseOptions(delimiter=","),
+        convert_options=pacsv.ConvertOptions(
+            column_types={"pid": "string", **_CSV_INT_DTYPES},
+        ),
+    )
+    names = set(table.column_names)
+    zeros = [0] * table.num_rows
+    return (
+        table.column("pid").to_pylist(),
+        table.column("arrival_time").to_pylist(),
+        table.column("burst_time").to_pylist(),
+        table.column("priority").to_pylist() if "priority" in names else zeros,
+        table.column("memory_required").to_pylist() if "memory_required" in names else zeros,
+    )
 
 
 class ProcessManager:
@@ -92,10 +208,15 @@ class ProcessManager:
 
     Supports creating individual processes, bulk-loading from
     dictionaries or CSV files, validation, and resetting state.
+
+    Schedulers work on clones, so running a simulation never mutates
+    the registered processes and no reset is needed between runs.
     """
 
     def __init__(self):
         self._processes: List[Process] = []
+        self._by_pid: Dict[str, Process] = {}                # first process registered per pid
+        self._soa: Optional[Dict[str, np.ndarray]] = None   # built lazily by get_soa()
 
     # ── Creation ─────────────────────────────────────────
 
@@ -116,6 +237,8 @@ class ProcessManager:
             memory_required=memory_required,
         )
         self._processes.append(proc)
+        self._by_pid.setdefault(pid, proc)
+        self._soa = None
         return proc
 
     def load_from_dicts(self, data: List[dict]) -> List[Process]:
@@ -125,7 +248,7 @@ class ProcessManager:
         Each dict must contain keys: pid, arrival_time, burst_time.
         Optional keys: priority, memory_required.
         """
-        self._processes.clear()
+        self.clear()
         for entry in data:
             self.add_process(
                 pid=str(entry["pid"]),
@@ -136,12 +259,85 @@ class ProcessManager:
             )
         return self._processes
 
+    def load_from_objects(self, items: Iterable[Any]) -> List[Process]:
+        """
+        Bulk-load processes from objects exposing the same fields as
+        attributes (e.g. the API's Pydantic models).
+
+        Reads attributes directly, avoiding a per-item dict round-trip.
+        """
+        self.clear()
+        for item in items:
+            self.add_process(
+                pid=str(item.pid),
+                arrival_time=int(item.arrival_time),
+                burst_time=int(item.burst_time),
+                priority=int(getattr(item, "priority", 0)),
+                memory_required=int(getattr(item, "memory_required", 0)),
+            )
+        return self._processes
+
     def load_from_csv(self, filepath: str) -> List[Process]:
-        """Load processes from a CSV file."""
+        """
+        Load processes from a CSV file.
+
+        The header row must name pid, arrival_time and burst_time;
+        priority and memory_required columns are optional.  Columns are
+        resolved once and rows are read positionally.
+        """
+        self.clear()
+        size = os.path.getsize(filepath)
+        columns = None
+        if size >= ARROW_CSV_MIN_BYTES:
+            columns = _read_csv_columns_arrow(filepath)
+        if columns is None and size >= PANDAS_CSV_MIN_BYTES:
+            columns = _read_csv_columns_pandas(filepath)
+        if columns is not None:
+            return self._extend_from_columns(*columns)
+
         with open(filepath, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        return self.load_from_dicts(rows)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return self._processes
+            col = {name: i for i, name in enumerate(header)}
+            pid_col = col["pid"]
+            arrival_col = col["arrival_time"]
+            burst_col = col["burst_time"]
+            priority_col = col.get("priority")
+            memory_col = col.get("memory_required")
+
+            for row in reader:
+                if not row:
+                    continue
+                self.add_process(
+                    pid=row[pid_col],
+                    arrival_time=int(row[arrival_col]),
+                    burst_time=int(row[burst_col]),
+                    priority=int(row[priority_col]) if priority_col is not None else 0,
+                    memory_required=int(row[memory_col]) if memory_col is not None else 0,
+                )
+        return self._processes
+
+    def _extend_from_columns(
+        self,
+        pids: Sequence[str],
+        arrival: Sequence[int],
+        burst: Sequence[int],
+        priority: Sequence[int],
+        memory: Sequence[int],
+    ) -> List[Process]:
+        """Bulk-register processes from parallel column sequences."""
+        start = len(self._processes)
+        self._processes.extend(
+            Process(pid=pid, arrival_time=a, burst_time=b, priority=pr, memory_required=m)
+            for pid, a, b, pr, m in zip(pids, arrival, burst, priority, memory)
+        )
+        by_pid = self._by_pid
+        for proc in self._processes[start:]:
+            by_pid.setdefault(proc.pid, proc)
+        self._soa = None
+        return self._processes
 
     # ── Access ───────────────────────────────────────────
 
@@ -149,12 +345,15 @@ class ProcessManager:
         """Return a copy of all registered processes."""
         return list(self._processes)
 
+    def get_soa(self) -> Dict[str, np.ndarray]:
+        """Return the processes' scheduling fields as parallel int64 arrays."""
+        if self._soa is None:
+            self._soa = to_soa(self._processes)
+        return self._soa
+
     def get_by_pid(self, pid: str) -> Optional[Process]:
         """Find a process by its PID."""
-        for p in self._processes:
-            if p.pid == pid:
-                return p
-        return None
+        return self._by_pid.get(pid)
 
     # ── Utilities ────────────────────────────────────────
 
@@ -166,26 +365,37 @@ class ProcessManager:
     def clear(self) -> None:
         """Remove all processes."""
         self._processes.clear()
+        self._by_pid.clear()
+        self._soa = None
 
     def validate(self) -> List[str]:
         """
         Validate all processes and return a list of error messages.
         An empty list means all processes are valid.
         """
+        procs = self._processes
         errors: List[str] = []
-        seen_pids: set = set()
-        for p in self._processes:
-            if p.pid in seen_pids:
-                errors.append(f"Duplicate PID: {p.pid}")
-            seen_pids.add(p.pid)
-            if p.arrival_time < 0:
-                errors.append(f"{p.pid}: arrival_time cannot be negative")
-            if p.burst_time <= 0:
-                errors.append(f"{p.pid}: burst_time must be positive")
-            if p.priority < 0:
-                errors.append(f"{p.pid}: priority cannot be negative")
-            if p.memory_required < 0:
-                errors.append(f"{p.pid}: memory_required cannot be negative")
+        # The pid index only falls short of the list when a pid repeats
+        if len(self._by_pid) != len(procs):
+            counts = Counter(p.pid for p in procs)
+            errors.extend(f"Duplicate PID: {pid}" for pid, c in counts.items() if c > 1)
+
+        # One vectorized pass per constraint over the SoA view
+        try:
+            soa = self.get_soa()
+        except OverflowError:
+            # Some value is beyond int64; run the same checks on exact ints
+            soa = to_soa(procs, dtype=object)
+        checks = (
+            (soa["arrival"] < 0, "arrival_time cannot be negative"),
+            (soa["burst"] <= 0, "burst_time must be positive"),
+            (soa["priority"] < 0, "priority cannot be negative"),
+            (soa["memory"] < 0, "memory_required cannot be negative"),
+            (soa["arrival"] > MAX_FIELD_VALUE, f"arrival_time must be at most {MAX_FIELD_VALUE}"),
+            (soa["burst"] > MAX_FIELD_VALUE, f"burst_time must be at most {MAX_FIELD_VALUE}"),
+        )
+        for bad, message in checks:
+            errors.extend(f"{procs[i].pid}: {message}" for i in np.flatnonzero(bad))
         return errors
 
     def __len__(self) -> int:
@@ -9,13 +9,18 @@ Provides four classic scheduling algorithms:
 
 Each scheduler returns a ScheduleResult containing the Gantt chart
 timeline, per-process metrics, and a step-by-step simulation log.
+Pass collect_log=False to run() to skip formatting the log when the
+caller only needs timings.
 """
 
 from __future__ import annotations
 
-import copy
+import heapq
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from .process_manager import Process, ProcessState
 
@@ -31,31 +36,83 @@ class ScheduleResult:
     Attributes:
         timeline:   Gantt chart entries [{pid, start, end}, …].
         processes:  Per-process dicts with computed timing fields.
-        log:        Human-readable step-by-step log lines.
+        log:        Human-readable step-by-step log lines (empty when
+                    run with collect_log=False).
+        waiting_time, completion_time, turnaround_time:
+                    The same timings keyed by pid, for completed processes.
+        timeline_pids:
+                    The pid of each timeline entry, in order.
+        non_idle_timeline:
+                    timeline_pids without the IDLE slices.
     """
     timeline: List[dict] = field(default_factory=list)
     processes: List[dict] = field(default_factory=list)
     log: List[str] = field(default_factory=list)
+    waiting_time: Dict[str, int] = field(default_factory=dict)
+    completion_time: Dict[str, int] = field(default_factory=dict)
+    turnaround_time: Dict[str, int] = field(default_factory=dict)
+    timeline_pids: Tuple[str, ...] = ()
+    non_idle_timeline: Tuple[str, ...] = ()
 
 
 # ── Helper ──────────────────────────────────────────────
 
-
-def _deep_copy_processes(processes: List[Process]) -> List[Process]:
-    """Return independent copies so the originals are untouched."""
-    return copy.deepcopy(processes)
-
-
-def _finalize(procs: List[Process], timeline: List[dict], log: List[str]) -> ScheduleResult:
-    """Compute per-process metrics and package the result."""
-    proc_dicts = []
-    for p in procs:
-        if p.completion_time is not None and p.start_time is not None:
-            p.turnaround_time = p.completion_time - p.arrival_time
-            p.waiting_time = p.turnaround_time - p.burst_time
-            p.response_time = p.start_time - p.arrival_time
-        proc_dicts.append(p.to_dict())
-    return ScheduleResult(timeline=timeline, processes=proc_dicts, log=log)
+# Step-log templates.  Schedulers buffer (template, args) pairs and
+# _finalize renders them in one pass.
+_LOG_IDLE = "t=%d: CPU idle until t=%d"
+_LOG_START = "t=%d: %s starts (burst=%d)"
+_LOG_START_PRIORITY = "t=%d: %s starts (priority=%d, burst=%d)"
+_LOG_RUN = "t=%d: %s runs for %d (remaining=%d→%d)"
+_LOG_DONE = "t=%d: %s completed"
+
+
+def _clone_processes(processes: List[Process]) -> List[Process]:
+    """Return independent, freshly reset copies so the originals are untouched."""
+    return [p.clone() for p in processes]
+
+
+def _finalize(
+    procs: List[Process],
+    tl_pid: List[str],
+    tl_start: List[int],
+    tl_end: List[int],
+    log: List[tuple],
+) -> ScheduleResult:
+    """Compute per-process metrics, build the timeline dicts and package the result."""
+    timeline = [
+        {"pid": pid, "start": start, "end": end}
+        for pid, start, end in zip(tl_pid, tl_start, tl_end)
+    ]
+    result = ScheduleResult(
+        timeline=timeline,
+        timeline_pids=tuple(tl_pid),
+        non_idle_timeline=tuple(pid for pid in tl_pid if pid != "IDLE"),
+    )
+    done = [p for p in procs if p.completion_time is not None and p.start_time is not None]
+    if done:
+        k = len(done)
+        arrival = np.fromiter((p.arrival_time for p in done), dtype=np.int64, count=k)
+        burst = np.fromiter((p.burst_time for p in done), dtype=np.int64, count=k)
+        start = np.fromiter((p.start_time for p in done), dtype=np.int64, count=k)
+        completion = np.fromiter((p.completion_time for p in done), dtype=np.int64, count=k)
+
+        turnaround = completion - arrival
+        waiting = turnaround - burst
+        response = start - arrival
+
+        # tolist() hands back Python ints for the result payload
+        wt_by_pid = result.waiting_time
+        ct_by_pid = result.completion_time
+        tat_by_pid = result.turnaround_time
+        for p, tat, wt, rt in zip(done, turnaround.tolist(), waiting.tolist(), response.tolist()):
+            p.turnaround_time = tat_by_pid[p.pid] = tat
+            p.waiting_time = wt_by_pid[p.pid] = wt
+            p.response_time = rt
+            ct_by_pid[p.pid] = p.completion_time
+
+    result.processes = [p.to_dict() for p in procs]
+    result.log = [template % args for template, args in log]
+    return result
 
 
 # ══════════════════════════════════════════════════════════
@@ -69,35 +126,50 @@ class FCFSScheduler:
     of their arrival time.
     """
 
-    def run(self, processes: List[Process]) -> ScheduleResult:
-        procs = _deep_copy_processes(processes)
+    def run(self, processes: List[Process], collect_log: bool = True) -> ScheduleResult:
+        procs = _clone_processes(processes)
         procs.sort(key=lambda p: p.arrival_time)
 
-        current_time = 0
-        timeline: List[dict] = []
-        log: List[str] = []
-
-        for p in procs:
+        n = len(procs)
+        arrival = np.fromiter((p.arrival_time for p in procs), dtype=np.int64, count=n)
+        burst = np.fromiter((p.burst_time for p in procs), dtype=np.int64, count=n)
+
+        # end[i] = max(end[i-1], arrival[i]) + burst[i] with end[-1] = 0,
+        # unrolled into a prefix sum plus a running max of the idle shift.
+        csum = np.cumsum(burst)
+        shift = np.maximum(np.maximum.accumulate(arrival - (csum - burst)), 0)
+        end = csum + shift
+        start = end - burst
+        prev_end = np.concatenate(([0], end[:-1]))
+
+        tl_pid: List[str] = []      # timeline as parallel columns,
+        tl_start: List[int] = []    # zipped into dicts by _finalize
+        tl_end: List[int] = []
+        log: List[tuple] = []   # (template, args), rendered by _finalize
+
+        for p, s, e, idle_from in zip(procs, start.tolist(), end.tolist(), prev_end.tolist()):
             # Handle idle gap
-            if current_time < p.arrival_time:
-                log.append(f"t={current_time}: CPU idle until t={p.arrival_time}")
-                timeline.append({"pid": "IDLE", "start": current_time, "end": p.arrival_time})
-                current_time = p.arrival_time
-
-            p.start_time = current_time
-            p.state = ProcessState.RUNNING
-            log.append(f"t={current_time}: {p.pid} starts (burst={p.burst_time})")
-
-            end_time = current_time + p.burst_time
-            timeline.append({"pid": p.pid, "start": current_time, "end": end_time})
-
-            current_time = end_time
-            p.completion_time = current_time
+            if idle_from < s:
+                if collect_log:
+                    log.append((_LOG_IDLE, (idle_from, s)))
+                tl_pid.append("IDLE")
+                tl_start.append(idle_from)
+                tl_end.append(s)
+
+            if collect_log:
+                log.append((_LOG_START, (s, p.pid, p.burst_time)))
+            tl_pid.append(p.pid)
+            tl_start.append(s)
+            tl_end.append(e)
+
+            p.start_time = s
+            p.completion_time = e
             p.remaining_time = 0
             p.state = ProcessState.COMPLETED
-            log.append(f"t={current_time}: {p.pid} completed")
+            if collect_log:
+                log.append((_LOG_DONE, (e, p.pid)))
 
-        return _finalize(procs, timeline, log)
+        return _finalize(procs, tl_pid, tl_start, tl_end, log)
 
 
 # ══════════════════════════════════════════════════════════
@@ -111,49 +183,57 @@ class SJFScheduler:
     with the shortest burst time.  Ties broken by arrival time.
     """
 
-    def run(self, processes: List[Process]) -> ScheduleResult:
-        procs = _deep_copy_processes(processes)
-        n = len(procs)
-        completed = 0
+    def run(self, processes: List[Process], collect_log: bool = True) -> ScheduleResult:
+        procs = _clone_processes(processes)
+        arrivals = sorted(procs, key=lambda p: p.arrival_time)
+        n = len(arrivals)
+        next_idx = 0            # next process in arrivals not yet admitted
         current_time = 0
-        visited = [False] * n
-        timeline: List[dict] = []
-        log: List[str] = []
-
-        while completed < n:
-            # Find ready processes
-            ready = [
-                (i, p) for i, p in enumerate(procs)
-                if not visited[i] and p.arrival_time <= current_time
-            ]
+        ready: List[tuple] = []  # heap of (burst, arrival, arrival rank, process)
+        tl_pid: List[str] = []
+        tl_start: List[int] = []
+        tl_end: List[int] = []
+        log: List[tuple] = []
+
+        while next_idx < n or ready:
+            # Admit everything that has arrived
+            while next_idx < n and arrivals[next_idx].arrival_time <= current_time:
+                p = arrivals[next_idx]
+                heapq.heappush(ready, (p.burst_time, p.arrival_time, next_idx, p))
+                next_idx += 1
+
             if not ready:
                 # Jump to next arrival
-                next_arrival = min(p.arrival_time for i, p in enumerate(procs) if not visited[i])
-                log.append(f"t={current_time}: CPU idle until t={next_arrival}")
-                timeline.append({"pid": "IDLE", "start": current_time, "end": next_arrival})
+                next_arrival = arrivals[next_idx].arrival_time
+                if collect_log:
+                    log.append((_LOG_IDLE, (current_time, next_arrival)))
+                tl_pid.append("IDLE")
+                tl_start.append(current_time)
+                tl_end.append(next_arrival)
                 current_time = next_arrival
                 continue
 
             # Pick shortest burst; tie-break by arrival
-            ready.sort(key=lambda x: (x[1].burst_time, x[1].arrival_time))
-            idx, p = ready[0]
-            visited[idx] = True
+            p = heapq.heappop(ready)[-1]
 
             p.start_time = current_time
             p.state = ProcessState.RUNNING
-            log.append(f"t={current_time}: {p.pid} starts (burst={p.burst_time})")
+            if collect_log:
+                log.append((_LOG_START, (current_time, p.pid, p.burst_time)))
 
             end_time = current_time + p.burst_time
-            timeline.append({"pid": p.pid, "start": current_time, "end": end_time})
+            tl_pid.append(p.pid)
+            tl_start.append(current_time)
+            tl_end.append(end_time)
 
             current_time = end_time
             p.completion_time = current_time
             p.remaining_time = 0
             p.state = ProcessState.COMPLETED
-            log.append(f"t={current_time}: {p.pid} completed")
-            completed += 1
+            if collect_log:
+                log.append((_LOG_DONE, (current_time, p.pid)))
 
-        return _finalize(procs, timeline, log)
+        return _finalize(procs, tl_pid, tl_start, tl_end, log)
 
 
 # ══════════════════════════════════════════════════════════
@@ -168,47 +248,55 @@ class PriorityScheduler:
     Ties broken by arrival time.
     """
 
-    def run(self, processes: List[Process]) -> ScheduleResult:
-        procs = _deep_copy_processes(processes)
-        n = len(procs)
-        completed = 0
+    def run(self, processes: List[Process], collect_log: bool = True) -> ScheduleResult:
+        procs = _clone_processes(processes)
+        arrivals = sorted(procs, key=lambda p: p.arrival_time)
+        n = len(arrivals)
+        next_idx = 0            # next process in arrivals not yet admitted
         current_time = 0
-        visited = [False] * n
-        timeline: List[dict] = []
-        log: List[str] = []
-
-        while completed < n:
-            ready = [
-                (i, p) for i, p in enumerate(procs)
-                if not visited[i] and p.arrival_time <= current_time
-            ]
+        ready: List[tuple] = []  # heap of (priority, arrival, arrival rank, process)
+        tl_pid: List[str] = []
+        tl_start: List[int] = []
+        tl_end: List[int] = []
+        log: List[tuple] = []
+
+        while next_idx < n or ready:
+            while next_idx < n and arrivals[next_idx].arrival_time <= current_time:
+                p = arrivals[next_idx]
+                heapq.heappush(ready, (p.priority, p.arrival_time, next_idx, p))
+                next_idx += 1
+
             if not ready:
-                next_arrival = min(p.arrival_time for i, p in enumerate(procs) if not visited[i])
-                log.append(f"t={current_time}: CPU idle until t={next_arrival}")
-                timeline.append({"pid": "IDLE", "start": current_time, "end": next_arrival})
+                next_arrival = arrivals[next_idx].arrival_time
+                if collect_log:
+                    log.append((_LOG_IDLE, (current_time, next_arrival)))
+                tl_pid.append("IDLE")
+                tl_start.append(current_time)
+                tl_end.append(next_arrival)
                 current_time = next_arrival
                 continue
 
             # Pick highest priority (lowest number); tie-break by arrival
-            ready.sort(key=lambda x: (x[1].priority, x[1].arrival_time))
-            idx, p = ready[0]
-            visited[idx] = True
+            p = heapq.heappop(ready)[-1]
 
             p.start_time = current_time
             p.state = ProcessState.RUNNING
-            log.append(f"t={current_time}: {p.pid} starts (priority={p.priority}, burst={p.burst_time})")
+            if collect_log:
+                log.append((_LOG_START_PRIORITY, (current_time, p.pid, p.priority, p.burst_time)))
 
             end_time = current_time + p.burst_time
-            timeline.append({"pid": p.pid, "start": current_time, "end": end_time})
+            tl_pid.append(p.pid)
+            tl_start.append(current_time)
+            tl_end.append(end_time)
 
             current_time = end_time
             p.completion_time = current_time
             p.remaining_time = 0
             p.state = ProcessState.COMPLETED
-            log.append(f"t={current_time}: {p.pid} completed")
-            completed += 1
+            if collect_log:
+                log.append((_LOG_DONE, (current_time, p.pid)))
 
-        return _finalize(procs, timeline, log)
+        return _finalize(procs, tl_pid, tl_start, tl_end, log)
 
 
 # ══════════════════════════════════════════════════════════
@@ -221,6 +309,9 @@ class RoundRobinScheduler:
     Preemptive scheduler with a configurable time quantum.
     Processes rotate through the ready queue, each running
     for at most `quantum` time units before being preempted.
+
+    The constructor quantum is a default; run() may override it, so one
+    instance can serve runs with different quanta.
     """
 
     def __init__(self, quantum: int = 2):
@@ -228,41 +319,54 @@ class RoundRobinScheduler:
             raise ValueError("Time quantum must be a positive integer.")
         self.quantum = quantum
 
-    def run(self, processes: List[Process]) -> ScheduleResult:
-        procs = _deep_copy_processes(processes)
+    def run(
+        self,
+        processes: List[Process],
+        collect_log: bool = True,
+        quantum: Optional[int] = None,
+    ) -> ScheduleResult:
+        if quantum is None:
+            quantum = self.quantum
+        elif quantum <= 0:
+            raise ValueError("Time quantum must be a positive integer.")
+
+        procs = _clone_processes(processes)
         procs.sort(key=lambda p: p.arrival_time)
 
         current_time = 0
-        timeline: List[dict] = []
-        log: List[str] = []
+        tl_pid: List[str] = []
+        tl_start: List[int] = []
+        tl_end: List[int] = []
+        log: List[tuple] = []
 
-        from collections import deque
         ready_queue: deque = deque()
-        remaining = {p.pid: p for p in procs}
-        arrived = set()
         completed_count = 0
         n = len(procs)
+        arrival_ptr = 0     # procs[:arrival_ptr] have been enqueued
+
+        def admit(t: int) -> None:
+            """Enqueue every not-yet-admitted process that has arrived by t."""
+            nonlocal arrival_ptr
+            while arrival_ptr < n and procs[arrival_ptr].arrival_time <= t:
+                ready_queue.append(procs[arrival_ptr])
+                arrival_ptr += 1
 
         # Seed with processes arriving at time 0
-        for p in procs:
-            if p.arrival_time <= current_time:
-                ready_queue.append(p)
-                arrived.add(p.pid)
+        admit(current_time)
 
         while completed_count < n:
             if not ready_queue:
                 # Jump to next arrival
-                future = [p for p in procs if p.pid not in arrived]
-                if not future:
+                if arrival_ptr >= n:
                     break
-                next_arrival = min(p.arrival_time for p in future)
-                log.append(f"t={current_time}: CPU idle until t={next_arrival}")
-                timeline.append({"pid": "IDLE", "start": current_time, "end": next_arrival})
+                next_arrival = procs[arrival_ptr].arrival_time
+                if collect_log:
+                    log.append((_LOG_IDLE, (current_time, next_arrival)))
+                tl_pid.append("IDLE")
+                tl_start.append(current_time)
+                tl_end.append(next_arrival)
                 current_time = next_arrival
-                for p in procs:
-                    if p.pid not in arrived and p.arrival_time <= current_time:
-                        ready_queue.append(p)
-                        arrived.add(p.pid)
+                admit(current_time)
                 continue
 
             p = ready_queue.popleft()
@@ -271,31 +375,32 @@ class RoundRobinScheduler:
             if p.start_time is None:
                 p.start_time = current_time
 
-            run_time = min(self.quantum, p.remaining_time)
+            run_time = min(quantum, p.remaining_time)
             p.state = ProcessState.RUNNING
-            log.append(
-                f"t={current_time}: {p.pid} runs for {run_time} "
-                f"(remaining={p.remaining_time}→{p.remaining_time - run_time})"
-            )
+            if collect_log:
+                log.append((
+                    _LOG_RUN,
+                    (current_time, p.pid, run_time, p.remaining_time, p.remaining_time - run_time),
+                ))
 
             start = current_time
             current_time += run_time
             p.remaining_time -= run_time
-            timeline.append({"pid": p.pid, "start": start, "end": current_time})
+            tl_pid.append(p.pid)
+            tl_start.append(start)
+            tl_end.append(current_time)
 
             # Enqueue newly arrived processes BEFORE re-enqueuing current
-            for proc in procs:
-                if proc.pid not in arrived and proc.arrival_time <= current_time:
-                    ready_queue.append(proc)
-                    arrived.add(proc.pid)
+            admit(current_time)
 
             if p.remaining_time == 0:
                 p.completion_time = current_time
                 p.state = ProcessState.COMPLETED
                 completed_count += 1
-                log.append(f"t={current_time}: {p.pid} completed")
+                if collect_log:
+                    log.append((_LOG_DONE, (current_time, p.pid)))
             else:
                 p.state = ProcessState.READY
                 ready_queue.append(p)
 
-        return _finalize(procs, timeline, log)
+        return _finalize(procs, tl_pid, tl_start, tl_end, log)
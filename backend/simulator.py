@@ -10,9 +10,9 @@ from __future__ import annotations
 import csv
 import io
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO
 
-from config import DEFAULT_TIME_QUANTUM, DEFAULT_MEMORY_FRAMES
+from config import DEFAULT_TIME_QUANTUM, DEFAULT_MEMORY_FRAMES, get_logger
 from modules.process_manager import ProcessManager, Process
 from modules.scheduler import (
     FCFSScheduler,
@@ -58,13 +58,26 @@ class Simulator:
     """
 
     def __init__(self):
+        get_logger()   # configure logging on first use, not at import
         self.pm = ProcessManager()
+        # Schedulers hold no per-run state (RR takes its quantum in run())
+        self._schedulers = {name: cls() for name, cls in SCHEDULER_MAP.items()}
+
+    def reset(self) -> None:
+        """Drop all loaded processes so the simulator can be reused."""
+        self.pm.clear()
 
     # ── Process Loading ──────────────────────────────────
 
-    def load_processes(self, data: List[dict]) -> None:
-        """Load processes from a list of dicts."""
-        self.pm.load_from_dicts(data)
+    def load_processes(self, data: Sequence[Any]) -> None:
+        """
+        Load processes from a list of dicts, or of objects carrying the
+        process fields as attributes (e.g. Pydantic request models).
+        """
+        if data and hasattr(data[0], "pid"):
+            self.pm.load_from_objects(data)
+        else:
+            self.pm.load_from_dicts(data)
         errors = self.pm.validate()
         if errors:
             raise ValueError(f"Invalid process data: {'; '.join(errors)}")
@@ -81,7 +94,10 @@ class Simulator:
     # ── Scheduling ───────────────────────────────────────
 
     def run_scheduling(
-        self, algorithm: str, quantum: int = DEFAULT_TIME_QUANTUM
+        self,
+        algorithm: str,
+        quantum: int = DEFAULT_TIME_QUANTUM,
+        collect_log: bool = True,
     ) -> Dict[str, Any]:
         """
         Run a single scheduling algorithm.
@@ -89,6 +105,7 @@ class Simulator:
         Args:
             algorithm: One of 'fcfs', 'sjf', 'priority', 'rr'.
             quantum:   Time quantum (only used for Round Robin).
+            collect_log: Build the step-by-step log (empty list if False).
 
         Returns:
             {timeline, metrics, aggregates, log}
@@ -97,15 +114,13 @@ class Simulator:
         if algo not in SCHEDULER_MAP:
             raise ValueError(f"Unknown algorithm '{algorithm}'. Choose from: {list(SCHEDULER_MAP)}")
 
-        self.pm.reset()
         processes = self.pm.get_all()
+        scheduler = self._schedulers[algo]
 
         if algo == "rr":
-            scheduler = RoundRobinScheduler(quantum=quantum)
+            result: ScheduleResult = scheduler.run(processes, collect_log=collect_log, quantum=quantum)
         else:
-            scheduler = SCHEDULER_MAP[algo]()
-
-        result: ScheduleResult = scheduler.run(processes)
+            result = scheduler.run(processes, collect_log=collect_log)
         metrics = MetricsCalculator.calculate(result.processes, result.timeline)
 
         logger.info("Scheduling [%s] complete — avg WT=%.2f, avg TAT=%.2f",
@@ -132,11 +147,13 @@ class Simulator:
         Returns:
             {results: [{algorithm, timeline, metrics, aggregates, log}, …],
              comparison: [{algorithm, avg_wt, avg_tat, …}, …]}
+
+        Step logs are not collected here, so each result's log is empty.
         """
         all_results = {}
         all_metrics = {}
         for algo in SCHEDULER_MAP:
-            res = self.run_scheduling(algo, quantum=quantum)
+            res = self.run_scheduling(algo, quantum=quantum, collect_log=False)
             all_results[algo.upper()] = res
             all_metrics[algo.upper()] = res["aggregates"]
 
@@ -157,6 +174,7 @@ class Simulator:
         reference_string: List[int],
         num_frames: int = DEFAULT_MEMORY_FRAMES,
         algorithm: str = "fifo",
+        record_history: bool = True,
     ) -> Dict[str, Any]:
         """
         Run a page replacement simulation.
@@ -165,6 +183,8 @@ class Simulator:
             reference_string: Sequence of page numbers.
             num_frames:       Number of page frames available.
             algorithm:        One of 'fifo', 'lru', 'optimal'.
+            record_history:   Keep per-step frame snapshots (skip for
+                              aggregate-only callers).
 
         Returns:
             {algorithm, total_faults, total_hits, hit_rate, history}
@@ -174,22 +194,41 @@ class Simulator:
             raise ValueError(f"Unknown memory algorithm '{algorithm}'. Choose from: {list(MEMORY_ALGO_MAP)}")
 
         replacer = MEMORY_ALGO_MAP[algo]()
-        result = replacer.simulate(reference_string, num_frames)
+        result = replacer.simulate(reference_string, num_frames, record_history)
 
         logger.info("Memory [%s] — %d faults, hit_rate=%.2f%%",
                      algo.upper(), result.total_faults, result.hit_rate * 100)
 
         return {"algorithm": algo.upper(), **result.to_dict()}
 
+    def iter_memory_simulation(
+        self,
+        reference_string: List[int],
+        num_frames: int = DEFAULT_MEMORY_FRAMES,
+        algorithm: str = "fifo",
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a page replacement simulation one step at a time.
+
+        The algorithm is validated eagerly; the returned iterator yields
+        {step, page, frames, fault} dicts as the simulation advances.
+        """
+        algo = algorithm.lower()
+        if algo not in MEMORY_ALGO_MAP:
+            raise ValueError(f"Unknown memory algorithm '{algorithm}'. Choose from: {list(MEMORY_ALGO_MAP)}")
+
+        return MEMORY_ALGO_MAP[algo]().simulate_iter(reference_string, num_frames)
+
     def run_memory_comparison(
         self,
         reference_string: List[int],
         num_frames: int = DEFAULT_MEMORY_FRAMES,
+        record_history: bool = True,
     ) -> List[Dict[str, Any]]:
         """Run all three page replacement algorithms and return comparison."""
         results = []
         for algo in MEMORY_ALGO_MAP:
-            res = self.run_memory_simulation(reference_string, num_frames, algo)
+            res = self.run_memory_simulation(reference_string, num_frames, algo, record_history)
             results.append(res)
         return results
 
@@ -202,9 +241,9 @@ class Simulator:
         Args:
             graph_data: {
                 processes: [pid, …],
-                resources: [{id, instances}, …],
-                requests: [{process, resource}, …],
-                assignments: [{resource, process}, …]
+                resources: [{id, instances} or (id, instances), …],
+                requests: [{process, resource} or (process, resource), …],
+                assignments: [{resource, process} or (process, resource), …]
             }
 
         Returns:
@@ -215,11 +254,16 @@ class Simulator:
         for pid in graph_data.get("processes", []):
             rag.add_process(pid)
         for res in graph_data.get("resources", []):
-            rag.add_resource(res["id"], res.get("instances", 1))
+            if isinstance(res, dict):
+                rag.add_resource(res["id"], res.get("instances", 1))
+            else:
+                rag.add_resource(*res)
         for req in graph_data.get("requests", []):
-            rag.add_request(req["process"], req["resource"])
+            pid, rid = (req["process"], req["resource"]) if isinstance(req, dict) else req
+            rag.add_request(pid, rid)
         for asn in graph_data.get("assignments", []):
-            rag.add_assignment(asn["resource"], asn["process"])
+            pid, rid = (asn["process"], asn["resource"]) if isinstance(asn, dict) else asn
+            rag.add_assignment(rid, pid)
 
         detection = rag.detect_deadlock()
         graph_viz = rag.get_graph_data()
@@ -231,12 +275,64 @@ class Simulator:
     # ── Export ────────────────────────────────────────────
 
     @staticmethod
-    def export_csv(data: List[dict]) -> str:
-        """Export a list of dicts as a CSV string."""
+    def _export_columns(data: List[dict]) -> List[str]:
+        """
+        Return the CSV columns (the first row's keys), checking every row.
+
+        Like csv.DictWriter, a row with a key outside those columns
+        raises ValueError instead of being silently truncated.
+        """
+        keys = list(data[0].keys())
+        columns = set(keys)
+        for row in data:
+            if not columns.issuperset(row):
+                wrong_fields = [k for k in row if k not in columns]
+                raise ValueError("dict contains fields not in fieldnames: "
+                                 + ", ".join(map(repr, wrong_fields)))
+        return keys
+
+    @staticmethod
+    def export_csv(data: List[dict], file: Optional[TextIO] = None) -> Optional[str]:
+        """
+        Export a list of dicts as CSV, with columns taken from the first row.
+
+        Returns the CSV as a string, or writes it straight to `file`
+        (opened with newline="") and returns None.  Missing keys become
+        empty cells; keys not in the first row raise ValueError.
+        """
+        output = io.StringIO() if file is None else file
+        if data:
+            keys = Simulator._export_columns(data)
+            writer = csv.writer(output)
+            writer.writerow(keys)
+            writer.writerows([row.get(k, "") for k in keys] for row in data)
+        return output.getvalue() if file is None else None
+
+    @staticmethod
+    def iter_export_csv(data: List[dict], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Yield the same CSV as export_csv() as UTF-8 chunks, built row by row.
+
+        Rows go through a small buffer that is flushed once it holds at
+        least `chunk_size` characters, so the full CSV text never exists
+        in memory at once.  The columns are checked eagerly, so a bad row
+        raises ValueError here rather than part-way through the stream.
+        """
         if not data:
-            return ""
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=data[0].keys())
-        writer.writeheader()
-        writer.writerows(data)
-        return output.getvalue()
+            return iter(())
+        return Simulator._iter_csv_chunks(data, Simulator._export_columns(data), chunk_size)
+
+    @staticmethod
+    def _iter_csv_chunks(data: List[dict], keys: List[str], chunk_size: int) -> Iterator[bytes]:
+        """Write `data` under the checked `keys` and yield it in encoded chunks."""
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(keys)
+        for row in data:
+            writer.writerow([row.get(k, "") for k in keys])
+            if buf.tell() >= chunk_size:
+                yield buf.getvalue().encode("utf-8")
+                buf.seek(0)
+                buf.truncate()
+        if buf.tell():
+            yield buf.getvalue().encode("utf-8")
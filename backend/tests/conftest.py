@@ -0,0 +1,11 @@
+"""
+conftest.py - Shared pytest setup for the backend test suite.
+
+Puts the backend directory on sys.path once per session so the test
+modules can import `modules.*` directly.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
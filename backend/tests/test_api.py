@@ -0,0 +1,141 @@
+"""
+test_api.py - Request-level tests for the FastAPI server.
+
+Exercises input validation and the streaming endpoints through
+FastAPI's TestClient.
+"""
+
+import warnings
+
+import orjson
+import pytest
+
+pytest.importorskip("httpx")   # required by fastapi.testclient
+
+from fastapi.testclient import TestClient
+
+import api
+from api import app
+from modules.process_manager import MAX_FIELD_VALUE
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("field", ["arrival_time", "burst_time"])
+def test_schedule_rejects_out_of_range_fields(field):
+    """Times above MAX_FIELD_VALUE are a 422, not a wrong answer or a 500."""
+    proc = {"pid": "P1", "arrival_time": 0, "burst_time": 1, field: MAX_FIELD_VALUE + 1}
+    r = client.post("/api/schedule", json={"processes": [proc], "algorithm": "fcfs"})
+    assert r.status_code == 422
+
+
+def test_schedule_accepts_max_field_values():
+    """Bounded values at the cap schedule exactly."""
+    procs = [
+        {"pid": "P1", "arrival_time": 0, "burst_time": MAX_FIELD_VALUE},
+        {"pid": "P2", "arrival_time": 0, "burst_time": MAX_FIELD_VALUE},
+    ]
+    r = client.post("/api/schedule", json={"processes": procs, "algorithm": "fcfs"})
+    assert r.status_code == 200
+    assert r.json()["timeline"][-1]["end"] == 2 * MAX_FIELD_VALUE
+
+
+def test_memory_stream_matches_memory_history():
+    """/api/memory/stream should emit the same steps as /api/memory's history."""
+    body = {
+        "reference_string": [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2],
+        "num_frames": 3,
+        "algorithm": "lru",
+    }
+    full = client.post("/api/memory", json=body).json()
+    r = client.post("/api/memory/stream", json=body)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    assert [orjson.loads(line) for line in r.text.splitlines()] == full["history"]
+
+
+def test_memory_stream_rejects_unknown_algorithm():
+    body = {"reference_string": [1, 2, 3], "num_frames": 3, "algorithm": "nope"}
+    assert client.post("/api/memory/stream", json=body).status_code == 422
+
+
+def test_pooled_simulators_are_emptied_on_return():
+    """A finished request must not leave its processes in the pool."""
+    procs = [{"pid": "P1", "arrival_time": 0, "burst_time": 3}]
+    r = client.post("/api/schedule", json={"processes": procs, "algorithm": "fcfs"})
+    assert r.status_code == 200
+    assert api._SIM_POOL
+    assert all(len(sim.pm) == 0 for sim in api._SIM_POOL)
+
+
+def test_export_streams_csv():
+    rows = [{"pid": "P1", "waiting_time": 0}, {"pid": "P2", "waiting_time": 5}]
+    r = client.post("/api/export", json=rows)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    assert r.text == "pid,waiting_time\r\nP1,0\r\nP2,5\r\n"
+
+
+def test_large_simulations_are_offloaded(monkeypatch):
+    """Requests at or above the offload thresholds run in a worker thread."""
+    offloaded = []
+    run_sync = api.anyio.to_thread.run_sync
+
+    async def recording_run_sync(func, *args):
+        offloaded.append(func.__name__)
+        return await run_sync(func, *args)
+
+    monkeypatch.setattr(api.anyio.to_thread, "run_sync", recording_run_sync)
+    procs = [{"pid": "P1", "arrival_time": 0, "burst_time": 3}]
+    pages = {"reference_string": [1, 2, 3, 1], "num_frames": 2, "algorithm": "fifo"}
+    graph = {"processes": ["P1"], "resources": [], "requests": [], "assignments": []}
+
+    small = [
+        client.post("/api/schedule", json={"processes": procs, "algorithm": "fcfs"}).json(),
+        client.post("/api/memory", json=pages).json(),
+        client.post("/api/deadlock", json=graph).json(),
+    ]
+    assert offloaded == []
+
+    monkeypatch.setattr(api, "OFFLOAD_MIN_PROCESSES", 1)
+    monkeypatch.setattr(api, "OFFLOAD_MIN_PAGES", 1)
+    monkeypatch.setattr(api, "OFFLOAD_MIN_GRAPH_ITEMS", 1)
+    large = [
+        client.post("/api/schedule", json={"processes": procs, "algorithm": "fcfs"}).json(),
+        client.post("/api/memory", json=pages).json(),
+        client.post("/api/deadlock", json=graph).json(),
+    ]
+    assert offloaded == ["run_scheduling", "run_memory_simulation", "run_deadlock_detection"]
+    assert large == small
+
+
+def test_compiled_optimal_runs_are_offloaded():
+    """Optimal runs long enough for the Numba kernel never compile it on the event loop."""
+    assert api._memory_offload_threshold("optimal") <= api.NUMBA_MIN_LENGTH + 1
+    assert api._memory_offload_threshold("fifo") == api.OFFLOAD_MIN_PAGES
+
+
+def test_schedule_serializes_integers_beyond_64_bits():
+    """Uncapped fields may exceed orjson's range; the response still renders."""
+    proc = {"pid": "P1", "arrival_time": 0, "burst_time": 1, "priority": 10**20}
+    r = client.post("/api/schedule", json={"processes": [proc], "algorithm": "priority"})
+    assert r.status_code == 200
+    assert r.json()["metrics"][0]["priority"] == 10**20
+
+
+def test_memory_request_keeps_reference_string_as_list():
+    """The reference string is a plain list and serializes without warnings."""
+    req = api.MemoryRequest(reference_string=[1, 2, 3], num_frames=2)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert req.model_dump()["reference_string"] == [1, 2, 3]
+
+
+def test_memory_rejects_pages_beyond_32_bits():
+    body = {"reference_string": [1, 2**31], "num_frames": 2, "algorithm": "optimal"}
+    assert client.post("/api/memory", json=body).status_code == 422
+
+
+def test_export_rejects_rows_with_extra_keys():
+    rows = [{"pid": "P1"}, {"pid": "P2", "waiting_time": 5}]
+    assert client.post("/api/export", json=rows).status_code == 422
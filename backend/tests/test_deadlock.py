@@ -5,13 +5,24 @@ Tests cycle detection in the Resource Allocation Graph for
 both deadlocked and safe configurations.
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 from modules.deadlock_detector import ResourceAllocationGraph
 
 
+def _wait_for(n, edges):
+    """
+    Build a RAG over P0..P{n-1} where each Pk holds Rk and an edge
+    (a, b) means Pa requests Rb, i.e. Pa waits for Pb.
+    """
+    rag = ResourceAllocationGraph()
+    for k in range(n):
+        rag.add_process(f"P{k}")
+        rag.add_resource(f"R{k}")
+        rag.add_assignment(f"R{k}", f"P{k}")
+    for a, b in edges:
+        rag.add_request(f"P{a}", f"R{b}")
+    return rag
+
+
 def test_circular_deadlock():
     """Three processes in a circular wait should be detected as deadlocked."""
     rag = ResourceAllocationGraph()
@@ -101,16 +112,24 @@ def test_clear():
     assert len(rag.resources) == 0
 
 
-if __name__ == "__main__":
-    tests = [v for k, v in globals().items() if k.startswith("test_")]
-    passed = 0
-    for t in tests:
-        try:
-            t()
-            print(f"  ✓ {t.__name__}")
-            passed += 1
-        except AssertionError as e:
-            print(f"  ✗ {t.__name__}: {e}")
-        except Exception as e:
-            print(f"  ✗ {t.__name__}: {e}")
-    print(f"\n{passed}/{len(tests)} tests passed")
+def test_long_ring_deadlock():
+    """A wait chain of thousands of processes must not hit the recursion limit."""
+    n = 5000
+    rag = _wait_for(n, [(k, (k + 1) % n) for k in range(n)])
+    result = rag.detect_deadlock()
+    assert result["deadlocked"] is True
+    assert len(result["cycle"]) == n
+
+
+def test_cycle_follows_wait_for_edges():
+    """Inside a multi-node SCC, the reported cycle must be a real closed walk."""
+    edges = [(0, 1), (1, 2), (2, 0), (1, 3), (3, 4), (4, 1), (2, 4), (4, 5), (5, 0)]
+    rag = _wait_for(6, edges)
+    result = rag.detect_deadlock()
+    assert result["deadlocked"] is True
+
+    cycle = result["cycle"]
+    wait_for = {(f"P{a}", f"P{b}") for a, b in edges}
+    assert len(set(cycle)) == len(cycle) >= 2
+    for here, there in zip(cycle, cycle[1:] + cycle[:1]):
+        assert (here, there) in wait_for
@@ -5,81 +5,150 @@ Verifies FIFO, LRU, and Optimal against the classic textbook
 reference string: [7,0,1,2,0,3,0,4,2,3,0,3,2] with 3 frames.
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import random
+from math import isclose
 
-from modules.memory_manager import FIFOPageReplacer, LRUPageReplacer, OptimalPageReplacer
+import numpy as np
+import pytest
 
+from modules import memory_manager
+from modules.memory_manager import (
+    NUMBA_MIN_LENGTH,
+    FIFOPageReplacer,
+    LRUPageReplacer,
+    OptimalPageReplacer,
+    PageReplacer,
+    simulate_all,
+)
 
-REF_STRING = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2]
-NUM_FRAMES = 3
 
+REF_STRING = bytes([7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2])
+NUM_FRAMES = 3
 
-def test_fifo_faults():
-    """FIFO with classic ref string should produce 10 page faults."""
-    result = FIFOPageReplacer().simulate(REF_STRING, NUM_FRAMES)
-    assert result.total_faults == 10, f"Expected 10 faults, got {result.total_faults}"
+# Replacers keep no state between simulate() calls, so one of each serves every test
+FIFO = FIFOPageReplacer()
+LRU = LRUPageReplacer()
+OPT = OptimalPageReplacer()
 
 
-def test_lru_faults():
-    """LRU with classic ref string should produce 9 page faults."""
-    result = LRUPageReplacer().simulate(REF_STRING, NUM_FRAMES)
-    assert result.total_faults == 9, f"Expected 9 faults, got {result.total_faults}"
+@pytest.fixture(scope="module")
+def classic():
+    """Each algorithm's result on the classic ref string, simulated once per module."""
+    return {
+        "fifo": FIFO.simulate(REF_STRING, NUM_FRAMES),
+        "lru": LRU.simulate(REF_STRING, NUM_FRAMES),
+        "optimal": OPT.simulate(REF_STRING, NUM_FRAMES),
+    }
 
 
-def test_optimal_faults():
-    """Optimal with classic ref string should produce 7 page faults (theoretical best)."""
-    result = OptimalPageReplacer().simulate(REF_STRING, NUM_FRAMES)
-    assert result.total_faults == 7, f"Expected 7 faults, got {result.total_faults}"
+@pytest.mark.parametrize("algorithm, expected", [
+    ("fifo", 10),
+    ("lru", 9),
+    ("optimal", 7),   # theoretical best
+])
+def test_faults(algorithm, expected, classic):
+    """Page faults on the classic ref string, per algorithm."""
+    result = classic[algorithm]
+    assert result.total_faults == expected, f"Expected {expected} faults, got {result.total_faults}"
 
 
-def test_optimal_beats_others():
+def test_optimal_beats_others(classic):
     """Optimal should never have more faults than FIFO or LRU."""
-    fifo = FIFOPageReplacer().simulate(REF_STRING, NUM_FRAMES)
-    lru = LRUPageReplacer().simulate(REF_STRING, NUM_FRAMES)
-    opt = OptimalPageReplacer().simulate(REF_STRING, NUM_FRAMES)
+    fifo, lru, opt = classic["fifo"], classic["lru"], classic["optimal"]
     assert opt.total_faults <= fifo.total_faults
     assert opt.total_faults <= lru.total_faults
 
 
-def test_history_length():
+@pytest.mark.parametrize("record_history", [True, False])
+def test_simulate_all_matches_individual_runs(record_history):
+    """The fused pass should reproduce each replacer's own simulate()."""
+    ref = list(REF_STRING * 10)
+    fused = simulate_all(ref, NUM_FRAMES, record_history)
+    for result, replacer in zip(fused, (FIFO, LRU, OPT)):
+        assert result == replacer.simulate(ref, NUM_FRAMES, record_history)
+
+
+def test_bytes_reference_string_matches_list():
+    """bytes and list reference strings should simulate identically."""
+    long_ref = REF_STRING * 10   # long enough for the compiled Optimal path
+    for replacer in (FIFO, LRU, OPT):
+        from_bytes = replacer.simulate(long_ref, NUM_FRAMES)
+        from_list = replacer.simulate(list(long_ref), NUM_FRAMES)
+        assert from_bytes == from_list
+
+
+def test_compiled_optimal_matches_python_path():
+    """The Numba Optimal kernel should reproduce the pure-Python _steps() path exactly."""
+    pytest.importorskip("numba")
+    if memory_manager.optimal_simulate is None:
+        pytest.skip("Numba kernel unavailable (no writable JIT cache)")
+    rng = random.Random(0)
+    for _ in range(200):
+        length = rng.randint(NUMBA_MIN_LENGTH + 1, 4 * NUMBA_MIN_LENGTH)
+        ref = [rng.randrange(12) for _ in range(length)]
+        frames = rng.randint(1, 6)
+        assert OPT.simulate(ref, frames) == PageReplacer.simulate(OPT, ref, frames)
+
+
+def test_compiled_optimal_skips_history_buffers():
+    """Without record_history the kernel should not build per-step frame rows."""
+    pytest.importorskip("numba")
+    if memory_manager.optimal_simulate is None:
+        pytest.skip("Numba kernel unavailable (no writable JIT cache)")
+    page_ids = np.array(list(REF_STRING * 10), dtype=np.int64)
+    faults, frames_flat, frame_counts = memory_manager.optimal_simulate(page_ids, NUM_FRAMES, False)
+    assert frames_flat.size == 0 and frame_counts.size == 0
+    recorded, _, _ = memory_manager.optimal_simulate(page_ids, NUM_FRAMES, True)
+    assert np.array_equal(faults, recorded)
+
+
+@pytest.mark.parametrize("replacer", [FIFO, LRU, OPT], ids=["fifo", "lru", "optimal"])
+def test_simulate_iter_matches_history(replacer):
+    """Streamed steps should equal the serialized history of a full run."""
+    streamed = list(replacer.simulate_iter(REF_STRING, NUM_FRAMES))
+    assert streamed == replacer.simulate(REF_STRING, NUM_FRAMES).to_dict()["history"]
+
+
+@pytest.mark.parametrize("replacer", [FIFO, LRU, OPT], ids=["fifo", "lru", "optimal"])
+@pytest.mark.parametrize("ref", [REF_STRING, REF_STRING * 10], ids=["classic", "long"])
+def test_record_history_false(replacer, ref):
+    """Skipping history should leave the totals unchanged."""
+    full = replacer.simulate(ref, NUM_FRAMES)
+    bare = replacer.simulate(ref, NUM_FRAMES, record_history=False)
+    assert bare.history == []
+    assert (bare.total_faults, bare.total_hits, bare.hit_rate) == (
+        full.total_faults, full.total_hits, full.hit_rate,
+    )
+
+
+def test_page_replacer_is_abstract():
+    """The base driver cannot be used without a _steps() policy."""
+    with pytest.raises(TypeError):
+        PageReplacer()
+
+
+def test_history_length(classic):
     """History should have one entry per reference string element."""
-    result = FIFOPageReplacer().simulate(REF_STRING, NUM_FRAMES)
+    result = classic["fifo"]
     assert len(result.history) == len(REF_STRING)
 
 
-def test_hit_rate_calculation():
+def test_hit_rate_calculation(classic):
     """Hit rate = hits / total accesses."""
-    result = FIFOPageReplacer().simulate(REF_STRING, NUM_FRAMES)
+    result = classic["fifo"]
     expected_rate = result.total_hits / len(REF_STRING)
-    assert abs(result.hit_rate - expected_rate) < 0.001
+    assert isclose(result.hit_rate, expected_rate, abs_tol=1e-3)
 
 
 def test_empty_reference_string():
     """Empty reference string should produce no faults."""
-    result = FIFOPageReplacer().simulate([], NUM_FRAMES)
+    result = FIFO.simulate([], NUM_FRAMES)
     assert result.total_faults == 0
     assert result.total_hits == 0
 
 
 def test_single_page_repeated():
     """Repeated access to the same page should only fault once."""
-    result = FIFOPageReplacer().simulate([5, 5, 5, 5], 3)
+    result = FIFO.simulate([5, 5, 5, 5], 3)
     assert result.total_faults == 1
     assert result.total_hits == 3
-
-
-if __name__ == "__main__":
-    tests = [v for k, v in globals().items() if k.startswith("test_")]
-    passed = 0
-    for t in tests:
-        try:
-            t()
-            print(f"  ✓ {t.__name__}")
-            passed += 1
-        except AssertionError as e:
-            print(f"  ✗ {t.__name__}: {e}")
-        except Exception as e:
-            print(f"  ✗ {t.__name__}: {e}")
-    print(f"\n{passed}/{len(tests)} tests passed")
@@ -0,0 +1,107 @@
+"""
+test_process_manager.py - Unit tests for process loading and validation.
+
+Covers ProcessManager.validate() and the CSV loaders.
+"""
+
+import pytest
+
+from modules import process_manager
+from modules.process_manager import MAX_FIELD_VALUE, ProcessManager
+
+FULL_CSV = (
+    "pid,arrival_time,burst_time,priority,memory_required\n"
+    "P1,0,6,2,40\n"
+    "007,1,8,1,30\n"
+    "P3,2,7,3,20\n"
+    "NA,3,2,1,10\n"
+    "null,4,1,0,5\n"
+)
+# Optional columns missing, columns reordered, a blank line
+MINIMAL_CSV = "burst_time,pid,arrival_time\n5,P1,0\n\n3,042,2\n"
+
+
+def _load(path):
+    pm = ProcessManager()
+    pm.load_from_csv(str(path))
+    return [p.to_dict() for p in pm.get_all()]
+
+
+def _types(rows):
+    return [{k: type(v) for k, v in r.items()} for r in rows]
+
+
+def _load_with_csv_reader(path, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(process_manager, "PANDAS_CSV_MIN_BYTES", float("inf"))
+        m.setattr(process_manager, "ARROW_CSV_MIN_BYTES", float("inf"))
+        return _load(path)
+
+
+def test_validate_reports_bad_fields():
+    """Each violated constraint should be reported against its pid."""
+    pm = ProcessManager()
+    pm.add_process("P1", arrival_time=-1, burst_time=3)
+    pm.add_process("P2", arrival_time=0, burst_time=0)
+    pm.add_process("P2", arrival_time=0, burst_time=2, priority=-1)
+    errors = pm.validate()
+    assert "Duplicate PID: P2" in errors
+    assert "P1: arrival_time cannot be negative" in errors
+    assert "P2: burst_time must be positive" in errors
+    assert "P2: priority cannot be negative" in errors
+
+
+def test_validate_handles_values_beyond_int64():
+    """Values too large for the int64 SoA view must not make validate() raise."""
+    pm = ProcessManager()
+    pm.add_process("P1", arrival_time=0, burst_time=10**19)
+    pm.add_process("P2", arrival_time=-(10**19), burst_time=1)
+    assert pm.validate() == [
+        "P2: arrival_time cannot be negative",
+        f"P1: burst_time must be at most {MAX_FIELD_VALUE}",
+    ]
+
+
+def test_validate_upper_bound():
+    """arrival_time and burst_time are capped at MAX_FIELD_VALUE, inclusive."""
+    pm = ProcessManager()
+    pm.add_process("P1", arrival_time=MAX_FIELD_VALUE, burst_time=MAX_FIELD_VALUE)
+    pm.add_process("P2", arrival_time=MAX_FIELD_VALUE + 1, burst_time=1)
+    pm.add_process("P3", arrival_time=0, burst_time=1, priority=10**19, memory_required=10**19)
+    assert pm.validate() == [f"P2: arrival_time must be at most {MAX_FIELD_VALUE}"]
+
+
+def test_csv_reader_path_defaults_optional_columns(tmp_path, monkeypatch):
+    """Missing priority/memory_required default to 0; pids stay strings."""
+    path = tmp_path / "procs.csv"
+    path.write_text(MINIMAL_CSV)
+    rows = _load_with_csv_reader(path, monkeypatch)
+    assert [(r["pid"], r["arrival_time"], r["burst_time"], r["priority"], r["memory_required"])
+            for r in rows] == [("P1", 0, 5, 0, 0), ("042", 2, 3, 0, 0)]
+
+
+@pytest.mark.parametrize("text", [FULL_CSV, MINIMAL_CSV], ids=["full", "minimal"])
+def test_pandas_csv_path_matches_csv_reader(text, tmp_path, monkeypatch):
+    """The pandas fast path should load exactly what csv.reader loads."""
+    pytest.importorskip("pandas")
+    path = tmp_path / "procs.csv"
+    path.write_text(text)
+    expected = _load_with_csv_reader(path, monkeypatch)
+    monkeypatch.setattr(process_manager, "PANDAS_CSV_MIN_BYTES", 0)
+    monkeypatch.setattr(process_manager, "ARROW_CSV_MIN_BYTES", float("inf"))
+    got = _load(path)
+    assert got == expected
+    assert _types(got) == _types(expected)   # plain ints/strs, not NumPy scalars
+
+
+@pytest.mark.parametrize("text", [FULL_CSV, MINIMAL_CSV], ids=["full", "minimal"])
+def test_arrow_csv_path_matches_csv_reader(text, tmp_path, monkeypatch):
+    """The pyarrow fast path should load exactly what csv.reader loads."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "procs.csv"
+    path.write_text(text)
+    expected = _load_with_csv_reader(path, monkeypatch)
+    monkeypatch.setattr(process_manager, "ARROW_CSV_MIN_BYTES", 0)
+    got = _load(path)
+    assert got == expected
+    assert _types(got) == _types(expected)
@@ -5,9 +5,9 @@ Verifies correctness of FCFS, SJF, Priority, and Round Robin schedulers
 against hand-calculated expected values.
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from functools import lru_cache
+
+import pytest
 
 from modules.process_manager import Process
 from modules.scheduler import (
@@ -18,58 +18,68 @@ from modules.scheduler import (
 )
 
 
-def make_processes():
-    """Standard 3-process test set."""
-    return [
-        Process(pid="P1", arrival_time=0, burst_time=6),
-        Process(pid="P2", arrival_time=1, burst_time=4),
-        Process(pid="P3", arrival_time=2, burst_time=2),
-    ]
+@lru_cache(maxsize=None)
+def _proc(pid: str, arrival: int, burst: int, priority: int = 0) -> Process:
+    """
+    Shared Process for the given signature.
+
+    Schedulers only ever run on clones, so tests can reuse instances.
+    """
+    return Process(pid=pid, arrival_time=arrival, burst_time=burst, priority=priority)
+
+
+@pytest.fixture(scope="module")
+def processes():
+    """Standard 3-process test set, built once per module."""
+    return (
+        _proc("P1", 0, 6),
+        _proc("P2", 1, 4),
+        _proc("P3", 2, 2),
+    )
+
+
+def test_run_leaves_inputs_untouched(processes):
+    """Schedulers work on clones, so the shared fixture is never mutated."""
+    for scheduler in (FCFSScheduler(), SJFScheduler(), PriorityScheduler(), RoundRobinScheduler()):
+        scheduler.run(processes)
+    assert all(p.completion_time is None and p.remaining_time == p.burst_time for p in processes)
 
 
 # ── FCFS ─────────────────────────────────────────────────
 
-def test_fcfs_order():
-    """FCFS should execute in arrival order."""
-    result = FCFSScheduler().run(make_processes())
-    pids = [e["pid"] for e in result.timeline if e["pid"] != "IDLE"]
-    assert pids == ["P1", "P2", "P3"]
+@pytest.fixture(scope="module")
+def fcfs_result(processes):
+    """One FCFS run over the standard set, shared by the FCFS tests."""
+    return FCFSScheduler().run(processes)
 
 
-def test_fcfs_metrics():
-    """FCFS waiting times: P1=0, P2=5, P3=8  →  avg=4.33"""
-    result = FCFSScheduler().run(make_processes())
-    wt = {p["pid"]: p["waiting_time"] for p in result.processes}
-    assert wt["P1"] == 0
-    assert wt["P2"] == 5   # start=6, arrival=1 → WT=6-1-4=5? Actually WT = TAT - BT
-    # P1: completes at 6, TAT=6, WT=0
-    # P2: completes at 10, TAT=9, WT=5
-    # P3: completes at 12, TAT=10, WT=8
-    assert wt["P3"] == 8
+def test_fcfs_order(fcfs_result):
+    """FCFS should execute in arrival order."""
+    assert fcfs_result.non_idle_timeline == ("P1", "P2", "P3")
 
 
-def test_fcfs_completion_times():
-    result = FCFSScheduler().run(make_processes())
-    ct = {p["pid"]: p["completion_time"] for p in result.processes}
-    assert ct["P1"] == 6
-    assert ct["P2"] == 10
-    assert ct["P3"] == 12
+# P1: completes at 6,  TAT=6,  WT=0
+# P2: completes at 10, TAT=9,  WT=5   (WT = TAT - BT)
+# P3: completes at 12, TAT=10, WT=8   →  avg WT=4.33
+@pytest.mark.parametrize("pid, wt, ct", [("P1", 0, 6), ("P2", 5, 10), ("P3", 8, 12)])
+def test_fcfs(pid, wt, ct, fcfs_result):
+    """FCFS waiting and completion times per process."""
+    assert fcfs_result.waiting_time[pid] == wt
+    assert fcfs_result.completion_time[pid] == ct
 
 
 # ── SJF ──────────────────────────────────────────────────
 
-def test_sjf_picks_shortest():
+def test_sjf_picks_shortest(processes):
     """SJF should pick P3 (burst=2) over P2 (burst=4) when both are ready."""
-    result = SJFScheduler().run(make_processes())
+    result = SJFScheduler().run(processes)
     # P1 runs first (only one at t=0). At t=6, P2 and P3 are ready.
     # SJF picks P3 (burst=2), then P2 (burst=4).
-    timeline_pids = [e["pid"] for e in result.timeline if e["pid"] != "IDLE"]
-    assert timeline_pids == ["P1", "P3", "P2"]
+    assert result.non_idle_timeline == ("P1", "P3", "P2")
 
 
-def test_sjf_metrics():
-    result = SJFScheduler().run(make_processes())
-    wt = {p["pid"]: p["waiting_time"] for p in result.processes}
+def test_sjf_metrics(processes):
+    wt = SJFScheduler().run(processes).waiting_time
     # P1: 0→6, WT=0
     # P3: 6→8, WT=6-2=4   (TAT=8-2=6, WT=6-2=4)
     # P2: 8→12, WT=8-1-4=7? (TAT=12-1=11, WT=11-4=7)
@@ -83,13 +93,12 @@ def test_sjf_metrics():
 def test_priority_order():
     """Lower priority number = higher priority."""
     procs = [
-        Process(pid="P1", arrival_time=0, burst_time=4, priority=3),
-        Process(pid="P2", arrival_time=0, burst_time=3, priority=1),
-        Process(pid="P3", arrival_time=0, burst_time=5, priority=2),
+        _proc("P1", 0, 4, 3),
+        _proc("P2", 0, 3, 1),
+        _proc("P3", 0, 5, 2),
     ]
     result = PriorityScheduler().run(procs)
-    pids = [e["pid"] for e in result.timeline if e["pid"] != "IDLE"]
-    assert pids == ["P2", "P3", "P1"]
+    assert result.non_idle_timeline == ("P2", "P3", "P1")
 
 
 # ── Round Robin ──────────────────────────────────────────
@@ -97,46 +106,41 @@ def test_priority_order():
 def test_rr_preemption():
     """RR(q=2) should preempt processes after 2 time units."""
     procs = [
-        Process(pid="P1", arrival_time=0, burst_time=5),
-        Process(pid="P2", arrival_time=0, burst_time=3),
+        _proc("P1", 0, 5),
+        _proc("P2", 0, 3),
     ]
     result = RoundRobinScheduler(quantum=2).run(procs)
-    pids = [e["pid"] for e in result.timeline]
     # Expected: P1(2), P2(2), P1(2), P2(1), P1(1)
-    assert pids == ["P1", "P2", "P1", "P2", "P1"]
+    assert result.timeline_pids == ("P1", "P2", "P1", "P2", "P1")
 
 
 def test_rr_completion():
     """RR(q=2): P1(burst=5), P2(burst=3) — verify completion times."""
     procs = [
-        Process(pid="P1", arrival_time=0, burst_time=5),
-        Process(pid="P2", arrival_time=0, burst_time=3),
+        _proc("P1", 0, 5),
+        _proc("P2", 0, 3),
     ]
-    result = RoundRobinScheduler(quantum=2).run(procs)
-    ct = {p["pid"]: p["completion_time"] for p in result.processes}
+    ct = RoundRobinScheduler(quantum=2).run(procs).completion_time
     assert ct["P2"] == 7   # P2 runs at [2-4] and [6-7]
     assert ct["P1"] == 8   # P1 runs at [0-2], [4-6], [7-8]
 
 
 def test_rr_quantum_validation():
     """Quantum must be positive."""
-    try:
+    with pytest.raises(ValueError):
         RoundRobinScheduler(quantum=0)
-        assert False, "Should have raised ValueError"
-    except ValueError:
-        pass
-
-
-if __name__ == "__main__":
-    tests = [v for k, v in globals().items() if k.startswith("test_")]
-    passed = 0
-    for t in tests:
-        try:
-            t()
-            print(f"  ✓ {t.__name__}")
-            passed += 1
-        except AssertionError as e:
-            print(f"  ✗ {t.__name__}: {e}")
-        except Exception as e:
-            print(f"  ✗ {t.__name__}: {e}")
-    print(f"\n{passed}/{len(tests)} tests passed")
+
+
+def test_rr_quantum_override_on_cached_instance():
+    """One RoundRobinScheduler instance can serve runs with different quanta."""
+    rr = RoundRobinScheduler()
+    procs = [_proc("P1", 0, 5), _proc("P2", 0, 3)]
+    q1 = rr.run(procs, quantum=1)
+    assert q1.timeline_pids == ("P1", "P2", "P1", "P2", "P1", "P2", "P1", "P1")
+    q3 = rr.run(procs, quantum=3)
+    assert [(e["pid"], e["start"], e["end"]) for e in q3.timeline] == [
+        ("P1", 0, 3), ("P2", 3, 6), ("P1", 6, 8),
+    ]
+    assert rr.quantum == 2   # the override does not stick
+    with pytest.raises(ValueError):
+        rr.run(procs, quantum=0)
@@ -0,0 +1,49 @@
+"""
+test_simulator.py - Unit tests for the Simulator facade.
+
+Covers the CSV export helpers.
+"""
+
+import io
+
+import pytest
+
+from simulator import Simulator
+
+ROWS = [
+    {"pid": f"P{i}", "waiting_time": i, "note": "a,b" if i % 7 == 0 else ""}
+    for i in range(500)
+]
+
+
+def test_iter_export_csv_matches_export_csv():
+    """Chunked export should join to exactly the string export."""
+    chunks = list(Simulator.iter_export_csv(ROWS, chunk_size=1024))
+    assert len(chunks) > 1
+    assert all(len(c) >= 1024 for c in chunks[:-1])
+    assert b"".join(chunks) == Simulator.export_csv(ROWS).encode("utf-8")
+
+
+def test_iter_export_csv_empty():
+    assert list(Simulator.iter_export_csv([])) == []
+
+
+def test_export_csv_to_file_matches_string():
+    """Writing to a file handle returns None and produces the string export."""
+    out = io.StringIO()
+    assert Simulator.export_csv(ROWS, file=out) is None
+    assert out.getvalue() == Simulator.export_csv(ROWS)
+
+
+def test_export_csv_missing_keys_become_empty_cells():
+    rows = [{"pid": "P1", "waiting_time": 0}, {"pid": "P2"}]
+    assert Simulator.export_csv(rows) == "pid,waiting_time\r\nP1,0\r\nP2,\r\n"
+
+
+def test_export_csv_rejects_keys_missing_from_first_row():
+    """Like csv.DictWriter, a column not in the first row is an error, not dropped."""
+    rows = [{"pid": "P1"}, {"pid": "P2", "waiting_time": 5}]
+    with pytest.raises(ValueError, match="'waiting_time'"):
+        Simulator.export_csv(rows)
+    with pytest.raises(ValueError, match="'waiting_time'"):
+        Simulator.iter_export_csv(rows)